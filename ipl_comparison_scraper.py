@@ -6,13 +6,21 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
-import pandas as pd
+import lxml.html
 import os
+import csv
 import time
 import json
 import datetime
 import requests
+from requests.adapters import HTTPAdapter
+import queue
+import atexit
+import threading
+import socket
+import argparse
+import functools
+import concurrent.futures
 from colorama import init, Fore, Style
 
 # Initialize colorama
@@ -21,6 +29,50 @@ init()
 # Define URLs
 TEAM_COMPARISON_URL = "https://www.iplt20.com/comparison/teams"
 PLAYER_COMPARISON_URL = "https://www.iplt20.com/comparison/players"
+TEAM_COMPARISON_API_URL = "https://www.iplt20.com/comparison/show-team-stats"
+
+# Matches the comparison table anywhere in a page or in the API's HTML fragment
+COMPARISON_TABLE_XPATH = "descendant-or-self::*[contains(concat(' ', normalize-space(@class), ' '), ' ih-comparison-table ')]"
+
+# Returns the comparison table headers and cell texts in one WebDriver round-trip
+EXTRACT_TABLE_SCRIPT = """
+var table = document.querySelector('.ih-comparison-table');
+if (!table) { return null; }
+var texts = function(elements) {
+    return Array.prototype.map.call(elements, function(e) { return e.innerText.trim(); });
+};
+return {
+    headers: texts(table.querySelectorAll('th')),
+    rows: Array.prototype.map.call(table.querySelectorAll('tbody tr'), function(tr) {
+        return texts(tr.querySelectorAll('td'));
+    })
+};
+"""
+
+# Locators used on the comparison pages
+LEFT_SLOT_LOCATOR = (By.CSS_SELECTOR, ".ih-tcomp-tsel-left")
+RIGHT_SLOT_LOCATOR = (By.CSS_SELECTOR, ".ih-tcomp-tsel-right")
+LEFT_SLOT_FALLBACK_LOCATOR = (By.CSS_SELECTOR, "div[class*='ih-tcomp-tsel-left']")
+RIGHT_SLOT_FALLBACK_LOCATOR = (By.CSS_SELECTOR, "div[class*='ih-tcomp-tsel-right']")
+PLAYER_SEARCH_LOCATOR = (By.CSS_SELECTOR, "input.ih-pl-srch")
+COMPARISON_TABLE_LOCATOR = (By.CSS_SELECTOR, ".ih-comparison-table")
+COMPARISON_ROW_LOCATOR = (By.CSS_SELECTOR, ".ih-comparison-table tbody tr")
+FILTER_LIST_XPATH = "//*[contains(concat(' ', normalize-space(@class), ' '), ' ih-td-filter-list ')]"
+
+# WebDriverWait objects reused per driver and timeout; a wait holds its driver,
+# so entries are dropped explicitly when close_driver_pool releases the driver
+_WAIT_CACHE = {}
+
+# Used to lowercase text inside XPath 1.0 expressions
+UPPERCASE_LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+LOWERCASE_LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+# Shared HTTP session so API calls reuse pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+})
+SESSION.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=10))
 
 # Define team codes to team names mapping
 TEAM_CODES = {
@@ -44,21 +96,78 @@ PLAYER_COMPARISON_FOLDER = os.path.join(COMPARISON_DATA_FOLDER, 'player_comparis
 # Debug files folder
 DEBUG_FILES_FOLDER = 'debug_files'
 
+# Set IPL_DEBUG=1 to save page snapshots on successful scrapes as well
+DEBUG = os.environ.get("IPL_DEBUG", "0") == "1"
+
+# Resources that never affect the comparison tables and are blocked in the browser
+BLOCKED_RESOURCE_URLS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.webp", "*.woff", "*.woff2", "*.mp4"]
+
+# Scrolls to the bottom and resolves once no DOM mutations happened for 300ms,
+# scrolling again whenever lazy loading makes the page taller
+SCROLL_TO_BOTTOM_SCRIPT = """
+var done = arguments[arguments.length - 1];
+var lastChange = Date.now();
+var observer = new MutationObserver(function() { lastChange = Date.now(); });
+observer.observe(document.body, {childList: true, subtree: true});
+window.scrollTo(0, document.body.scrollHeight);
+var timer = setInterval(function() {
+    if (window.scrollY + window.innerHeight < document.body.scrollHeight) {
+        window.scrollTo(0, document.body.scrollHeight);
+    }
+    if (Date.now() - lastChange > 300) {
+        clearInterval(timer);
+        observer.disconnect();
+        done(null);
+    }
+}, 100);
+"""
+SCROLL_SETTLE_TIMEOUT = 5
+
+# Number of browser instances used to scrape comparison pairs in parallel
+DRIVER_POOL_SIZE = 3
+
+# Browsers are left running between runs and reattached through their DevTools ports
+SESSION_FILE = '.selenium_session.json'
+CHROME_DEBUG_PORT = 9222
+
+# Comparisons scraped within this many seconds are loaded from disk instead of scraped again
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Serializes the first ChromeDriver lookup between pool workers
+DRIVER_PATH_LOCK = threading.Lock()
+
 # Create folders if they don't exist
 for folder in [COMPARISON_DATA_FOLDER, TEAM_COMPARISON_FOLDER, PLAYER_COMPARISON_FOLDER, DEBUG_FILES_FOLDER]:
     if not os.path.exists(folder):
         os.makedirs(folder)
         print(f"{Fore.GREEN}Created folder: {folder}{Style.RESET_ALL}")
 
-def setup_driver():
+@functools.lru_cache(maxsize=1)
+def resolve_chrome_driver_path():
+    """
+    Download or look up the ChromeDriver binary once per run
+    """
+    return ChromeDriverManager().install()
+
+def get_chrome_driver_path():
+    """
+    Return the cached ChromeDriver path, resolving it only for the first caller
+    """
+    # Pool workers start together; only one of them should hit webdriver_manager
+    with DRIVER_PATH_LOCK:
+        return resolve_chrome_driver_path()
+
+def setup_driver(debug_port=None):
     """
     Set up and return a Selenium WebDriver instance with improved error handling
+    
+    When a debug_port is given, Chrome is started detached with remote debugging
+    enabled on that port so that a later run can reattach to it with reuse_driver()
     """
     print(f"{Fore.CYAN}Setting up Chrome WebDriver...{Style.RESET_ALL}")
     
     chrome_options = Options()
-    # Remove headless mode to make browser visible
-    # chrome_options.add_argument('--headless')
+    chrome_options.add_argument('--headless=new')
     chrome_options.add_argument('--disable-gpu')
     chrome_options.add_argument('--window-size=1920,1080')
     chrome_options.add_argument('--disable-dev-shm-usage')
@@ -67,12 +176,19 @@ def setup_driver():
     chrome_options.add_argument('--disable-popup-blocking')
     chrome_options.add_argument('--log-level=3')  # Reduce logging
     chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
+    # Don't download images, they are not needed for the comparison data
+    chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    if debug_port:
+        # Keep the browser alive after this script exits
+        chrome_options.add_argument(f'--remote-debugging-port={debug_port}')
+        chrome_options.add_experimental_option("detach", True)
     
     try:
         # First try with ChromeDriverManager
         try:
-            service = Service(ChromeDriverManager().install())
+            service = Service(get_chrome_driver_path())
             driver = webdriver.Chrome(service=service, options=chrome_options)
+            block_heavy_resources(driver)
             print(f"{Fore.GREEN}Chrome WebDriver setup successful with ChromeDriverManager{Style.RESET_ALL}")
             return driver
         except Exception as e:
@@ -81,6 +197,7 @@ def setup_driver():
         # Try with default Chrome path
         try:
             driver = webdriver.Chrome(options=chrome_options)
+            block_heavy_resources(driver)
             print(f"{Fore.GREEN}Chrome WebDriver setup successful with default path{Style.RESET_ALL}")
             return driver
         except Exception as e:
@@ -93,11 +210,11 @@ def setup_driver():
             
             edge_options = webdriver.EdgeOptions()
             for arg in chrome_options.arguments:
-                if '--headless' not in arg:  # Keep visible mode for Edge too
-                    edge_options.add_argument(arg)
+                edge_options.add_argument(arg)
             
             edge_service = EdgeService(EdgeChromiumDriverManager().install())
             driver = webdriver.Edge(service=edge_service, options=edge_options)
+            block_heavy_resources(driver)
             print(f"{Fore.GREEN}Edge WebDriver setup successful as fallback{Style.RESET_ALL}")
             return driver
         except Exception as e:
@@ -110,13 +227,159 @@ def setup_driver():
         print(f"{Fore.RED}Error setting up WebDriver: {str(e)}{Style.RESET_ALL}")
         return None
 
+def is_port_open(port, host="127.0.0.1"):
+    """
+    Check whether something is listening on a local port
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.settimeout(0.5)
+        return sock.connect_ex((host, port)) == 0
+
+def load_session_ports():
+    """
+    Read the DevTools ports of browsers left running by a previous run
+    """
+    if not os.path.exists(SESSION_FILE):
+        return []
+    
+    try:
+        with open(SESSION_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f).get("debug_ports", [])
+    except Exception as e:
+        print(f"{Fore.YELLOW}Could not read {SESSION_FILE}: {str(e)}{Style.RESET_ALL}")
+        return []
+
+def save_session_ports(debug_ports):
+    """
+    Record the DevTools ports of the running browsers for the next run
+    """
+    with open(SESSION_FILE, 'w', encoding='utf-8') as f:
+        json.dump({"debug_ports": debug_ports, "timestamp": datetime.datetime.now().isoformat()}, f, indent=4)
+
+def reuse_driver(debug_port):
+    """
+    Attach a new WebDriver to a browser left running by a previous run
+    """
+    if not is_port_open(debug_port):
+        return None
+    
+    chrome_options = Options()
+    chrome_options.add_experimental_option("debuggerAddress", f"127.0.0.1:{debug_port}")
+    
+    try:
+        driver = webdriver.Chrome(service=Service(get_chrome_driver_path()), options=chrome_options)
+        block_heavy_resources(driver)
+        print(f"{Fore.GREEN}Reattached to running browser on port {debug_port}{Style.RESET_ALL}")
+        return driver
+    except Exception as e:
+        print(f"{Fore.YELLOW}Could not reattach to browser on port {debug_port}: {str(e)}{Style.RESET_ALL}")
+        return None
+
+def close_saved_browsers(debug_ports):
+    """
+    Quit browsers left running by a previous run that the new pool won't reuse
+    """
+    for debug_port in debug_ports:
+        driver = reuse_driver(debug_port)
+        if driver is None:
+            continue
+        try:
+            driver.quit()
+            print(f"{Fore.CYAN}Closed browser on port {debug_port}{Style.RESET_ALL}")
+        except Exception as e:
+            print(f"{Fore.YELLOW}Could not close browser on port {debug_port}: {str(e)}{Style.RESET_ALL}")
+
+def block_heavy_resources(driver):
+    """
+    Block images, fonts and media through the DevTools protocol
+    """
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_RESOURCE_URLS})
+    except Exception as e:
+        print(f"{Fore.YELLOW}Could not block heavy resources: {str(e)}{Style.RESET_ALL}")
+
+def create_driver_pool(size=DRIVER_POOL_SIZE, fresh=False):
+    """
+    Start (or reattach to) several WebDriver instances in parallel and return them in a queue
+    """
+    print(f"{Fore.CYAN}Starting {size} WebDriver instances...{Style.RESET_ALL}")
+    
+    debug_ports = [CHROME_DEBUG_PORT + slot for slot in range(size)]
+    saved_ports = load_session_ports()
+    
+    # Browsers from an earlier, larger pool (or all of them when starting fresh)
+    # would otherwise be left running once the session file is rewritten
+    close_saved_browsers([port for port in saved_ports if fresh or port not in debug_ports])
+    reusable_ports = [] if fresh else saved_ports
+    
+    def start_driver(debug_port):
+        driver = reuse_driver(debug_port) if debug_port in reusable_ports else None
+        return driver or setup_driver(debug_port)
+    
+    driver_pool = queue.Queue()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=size) as executor:
+        futures = [executor.submit(start_driver, debug_port) for debug_port in debug_ports]
+        for future in concurrent.futures.as_completed(futures):
+            driver = future.result()
+            if driver is not None:
+                driver_pool.put(driver)
+    
+    if not fresh:
+        save_session_ports(debug_ports)
+    
+    # Make sure the drivers are released even if the run is interrupted
+    atexit.register(close_driver_pool, driver_pool, fresh)
+    
+    return driver_pool
+
+def close_driver_pool(driver_pool, fresh=False):
+    """
+    Release every WebDriver instance left in the pool
+    
+    Browsers are kept running for the next run unless fresh is set, in which
+    case they are closed and the session file is removed
+    """
+    if driver_pool.empty():
+        return
+    
+    while not driver_pool.empty():
+        driver = driver_pool.get_nowait()
+        _WAIT_CACHE.pop(driver, None)
+        try:
+            if fresh:
+                driver.quit()
+            else:
+                # Stop only the driver process; the detached browser stays alive
+                driver.service.stop()
+        except Exception as e:
+            print(f"{Fore.YELLOW}Error closing WebDriver: {str(e)}{Style.RESET_ALL}")
+    
+    if fresh and os.path.exists(SESSION_FILE):
+        os.remove(SESSION_FILE)
+    print(f"{Fore.CYAN}Closed WebDriver pool{Style.RESET_ALL}")
+
+def scrape_with_pooled_driver(driver_pool, scrape_function, pair):
+    """
+    Borrow a driver from the pool, run one comparison scrape and return the driver
+    """
+    driver = driver_pool.get()
+    try:
+        return scrape_function(driver, *pair)
+    finally:
+        # Drop the previous page's DOM before handing the driver to the next pair
+        try:
+            driver.get("about:blank")
+        except Exception as e:
+            print(f"{Fore.YELLOW}Error resetting WebDriver: {str(e)}{Style.RESET_ALL}")
+        driver_pool.put(driver)
+
 def scroll_to_element(driver, element):
     """
     Scroll to make an element visible
     """
     try:
         driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-        time.sleep(0.5)  # Small pause after scrolling
     except Exception as e:
         print(f"{Fore.YELLOW}Error scrolling to element: {str(e)}{Style.RESET_ALL}")
 
@@ -126,43 +389,32 @@ def scroll_down_page(driver, scroll_amount=300):
     """
     try:
         driver.execute_script(f"window.scrollBy(0, {scroll_amount});")
-        time.sleep(0.5)  # Small pause after scrolling
     except Exception as e:
         print(f"{Fore.YELLOW}Error scrolling down page: {str(e)}{Style.RESET_ALL}")
 
 def scroll_to_bottom(driver):
     """
-    Scroll to the bottom of the page
+    Scroll to the bottom of the page and wait until lazy-loaded content stops arriving
     """
     try:
-        # First scroll quickly to the bottom to trigger any lazy loading
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(1)
-        
-        # Then scroll back up a bit to ensure everything is visible
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight * 0.9);")
-        time.sleep(0.5)
-        
-        # Then scroll through the page in steps to ensure all dynamic content loads
-        current_height = 0
-        new_height = driver.execute_script("return document.body.scrollHeight")
-        
-        while current_height < new_height:
-            current_height = new_height
-            driver.execute_script(f"window.scrollTo(0, {current_height * 0.7});")
-            time.sleep(0.5)
-            driver.execute_script(f"window.scrollTo(0, {current_height});")
-            time.sleep(1)
-            new_height = driver.execute_script("return document.body.scrollHeight")
-            
+        driver.set_script_timeout(SCROLL_SETTLE_TIMEOUT)
+        driver.execute_async_script(SCROLL_TO_BOTTOM_SCRIPT)
         print(f"{Fore.GREEN}Scrolled to bottom of page{Style.RESET_ALL}")
+    except TimeoutException:
+        print(f"{Fore.YELLOW}Page kept changing after scrolling, continuing anyway{Style.RESET_ALL}")
     except Exception as e:
         print(f"{Fore.YELLOW}Error scrolling to bottom: {str(e)}{Style.RESET_ALL}")
 
-def save_page_source(driver, filename_prefix):
+def save_page_source(driver, filename_prefix, on_error=False):
     """
     Save the current page source to a file for debugging
+    
+    Happy-path snapshots are only written when IPL_DEBUG=1; error snapshots
+    (on_error=True) are always written
     """
+    if not (DEBUG or on_error):
+        return None
+    
     timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
     filename = os.path.join(DEBUG_FILES_FOLDER, f"{filename_prefix}_{timestamp}.html")
     
@@ -172,6 +424,96 @@ def save_page_source(driver, filename_prefix):
     print(f"{Fore.GREEN}Saved page source to {filename}{Style.RESET_ALL}")
     return filename
 
+def get_wait(driver, timeout=10):
+    """
+    Return a cached WebDriverWait for the driver and timeout
+    """
+    waits = _WAIT_CACHE.get(driver)
+    if waits is None:
+        waits = _WAIT_CACHE.setdefault(driver, {})
+    if timeout not in waits:
+        waits[timeout] = WebDriverWait(driver, timeout)
+    return waits[timeout]
+
+def xpath_literal(text):
+    """
+    Quote a string for use as an XPath 1.0 string literal
+    """
+    if "'" not in text:
+        return f"'{text}'"
+    if '"' not in text:
+        return f'"{text}"'
+    parts = text.split("'")
+    return "concat('" + "', \"'\", '".join(parts) + "')"
+
+def wait_for_list_item(driver, text, timeout=10):
+    """
+    Wait for a visible filter list item containing the given text and return it
+    
+    The item is located directly with a case-insensitive XPath text filter,
+    so the list is not scanned element by element over the WebDriver protocol
+    """
+    xpath = (
+        f"{FILTER_LIST_XPATH}//li[contains(translate(normalize-space(.), '{UPPERCASE_LETTERS}', '{LOWERCASE_LETTERS}'), "
+        f"{xpath_literal(text.lower())})]"
+    )
+    return get_wait(driver, timeout).until(
+        EC.visibility_of_any_elements_located((By.XPATH, xpath))
+    )[0]
+
+def select_list_item(driver, text, description, timeout=10):
+    """
+    Find, click and confirm a filter list item containing the given text
+    
+    Returns False if no matching item shows up within the timeout
+    """
+    try:
+        item = wait_for_list_item(driver, text, timeout)
+    except TimeoutException:
+        print(f"{Fore.RED}Could not find {description}: {text}{Style.RESET_ALL}")
+        return False
+    
+    scroll_to_element(driver, item)
+    print(f"{Fore.GREEN}Selected {description}: {item.text}{Style.RESET_ALL}")
+    item.click()
+    
+    # The list closes (or re-renders) once the choice is applied; waiting for that
+    # keeps the next slot click from landing on the still-open list
+    try:
+        get_wait(driver, timeout).until(EC.invisibility_of_element(item))
+    except TimeoutException:
+        print(f"{Fore.YELLOW}Filter list still open after selecting {description}{Style.RESET_ALL}")
+    return True
+
+def click_selector(driver, locator, fallback_locator, description):
+    """
+    Wait for a selector slot to become clickable and click it
+    """
+    try:
+        get_wait(driver).until(EC.element_to_be_clickable(locator)).click()
+        return True
+    except Exception as e:
+        print(f"{Fore.RED}Error clicking {description} selector: {str(e)}{Style.RESET_ALL}")
+        
+        # Try alternative selector
+        try:
+            driver.find_element(*fallback_locator).click()
+            return True
+        except Exception as e2:
+            print(f"{Fore.RED}Error with alternative {description} selector: {str(e2)}{Style.RESET_ALL}")
+            return False
+
+def wait_for_comparison_table(driver):
+    """
+    Wait for the comparison table rows to render and scroll through the page
+    """
+    print(f"{Fore.CYAN}Waiting for comparison data to load...{Style.RESET_ALL}")
+    get_wait(driver, 15).until(EC.presence_of_element_located(COMPARISON_ROW_LOCATOR))
+    
+    # Scroll through the page to ensure all data is loaded
+    scroll_down_page(driver, 300)  # Initial scroll to see first part of comparison data
+    scroll_to_bottom(driver)  # Then scroll to the bottom to load everything
+
 def select_teams_for_comparison(driver, team1_code, team2_code):
     """
     Select two teams for comparison
@@ -181,96 +523,28 @@ def select_teams_for_comparison(driver, team1_code, team2_code):
         
         # Navigate to teams comparison page
         driver.get(TEAM_COMPARISON_URL)
-        time.sleep(3)  # Wait for page to load
         
         # Save initial page for debugging
         save_page_source(driver, "teams_comparison_page_initial")
         
         # Step 1: Click on the first "Click to Add Team" button
-        try:
-            first_add_team = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, ".ih-tcomp-tsel-left"))
-            )
-            first_add_team.click()
-            time.sleep(1)
-        except Exception as e:
-            print(f"{Fore.RED}Error clicking first team selector: {str(e)}{Style.RESET_ALL}")
-            
-            # Try alternative selector
-            try:
-                first_add_team = driver.find_element(By.XPATH, "//div[contains(@class, 'ih-tcomp-tsel-left')]")
-                first_add_team.click()
-                time.sleep(1)
-            except Exception as e2:
-                print(f"{Fore.RED}Error with alternative first team selector: {str(e2)}{Style.RESET_ALL}")
-                return False
+        if not click_selector(driver, LEFT_SLOT_LOCATOR, LEFT_SLOT_FALLBACK_LOCATOR, "first team"):
+            return False
         
         # Step 2: Find and select the first team
-        teams_list = WebDriverWait(driver, 10).until(
-            EC.presence_of_all_elements_located((By.CSS_SELECTOR, ".ih-td-filter-list li"))
-        )
-        
-        first_team_found = False
-        for team in teams_list:
-            if TEAM_CODES.get(team1_code, "") in team.text:
-                scroll_to_element(driver, team)
-                team.click()
-                first_team_found = True
-                print(f"{Fore.GREEN}Selected first team: {team.text}{Style.RESET_ALL}")
-                time.sleep(1)
-                break
-        
-        if not first_team_found:
-            print(f"{Fore.RED}Could not find first team: {team1_code}{Style.RESET_ALL}")
+        if not select_list_item(driver, TEAM_CODES.get(team1_code, team1_code), "first team"):
             return False
         
         # Step 3: Click on the second "Click to Add Team" button
-        try:
-            second_add_team = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, ".ih-tcomp-tsel-right"))
-            )
-            second_add_team.click()
-            time.sleep(1)
-        except Exception as e:
-            print(f"{Fore.RED}Error clicking second team selector: {str(e)}{Style.RESET_ALL}")
-            
-            # Try alternative selector
-            try:
-                second_add_team = driver.find_element(By.XPATH, "//div[contains(@class, 'ih-tcomp-tsel-right')]")
-                second_add_team.click()
-                time.sleep(1)
-            except Exception as e2:
-                print(f"{Fore.RED}Error with alternative second team selector: {str(e2)}{Style.RESET_ALL}")
-                return False
+        if not click_selector(driver, RIGHT_SLOT_LOCATOR, RIGHT_SLOT_FALLBACK_LOCATOR, "second team"):
+            return False
         
         # Step 4: Find and select the second team
-        teams_list = WebDriverWait(driver, 10).until(
-            EC.presence_of_all_elements_located((By.CSS_SELECTOR, ".ih-td-filter-list li"))
-        )
-        
-        second_team_found = False
-        for team in teams_list:
-            if TEAM_CODES.get(team2_code, "") in team.text:
-                scroll_to_element(driver, team)
-                team.click()
-                second_team_found = True
-                print(f"{Fore.GREEN}Selected second team: {team.text}{Style.RESET_ALL}")
-                time.sleep(2)  # Wait longer for comparison to load
-                break
-        
-        if not second_team_found:
-            print(f"{Fore.RED}Could not find second team: {team2_code}{Style.RESET_ALL}")
+        if not select_list_item(driver, TEAM_CODES.get(team2_code, team2_code), "second team"):
             return False
         
         # Step 5: Wait for comparison data to load and scroll through it
-        print(f"{Fore.CYAN}Waiting for comparison data to load...{Style.RESET_ALL}")
-        time.sleep(3)
-        
-        # Scroll through the page to ensure all data is loaded
-        scroll_down_page(driver, 300)  # Initial scroll to see first part of comparison data
-        time.sleep(1)
-        
-        scroll_to_bottom(driver)  # Then scroll to the bottom to load everything
+        wait_for_comparison_table(driver)
         
         # Save the comparison page after scrolling
         save_page_source(driver, f"team_comparison_{team1_code}_vs_{team2_code}_after_scroll")
@@ -279,7 +553,23 @@ def select_teams_for_comparison(driver, team1_code, team2_code):
     
     except Exception as e:
         print(f"{Fore.RED}Error selecting teams for comparison: {str(e)}{Style.RESET_ALL}")
-        save_page_source(driver, f"error_team_comparison_{team1_code}_vs_{team2_code}")
+        save_page_source(driver, f"error_team_comparison_{team1_code}_vs_{team2_code}", on_error=True)
+        return False
+
+def search_and_select_player(driver, player_name, description):
+    """
+    Type a player name into the search box and click the matching result
+    """
+    try:
+        search_input = get_wait(driver).until(EC.presence_of_element_located(PLAYER_SEARCH_LOCATOR))
+        search_input.clear()
+        search_input.send_keys(player_name)
+        
+        # Wait for the search results to contain the player instead of sleeping
+        return select_list_item(driver, player_name, f"{description} player")
+        
+    except Exception as e:
+        print(f"{Fore.RED}Error searching for {description} player: {str(e)}{Style.RESET_ALL}")
         return False
 
 def select_players_for_comparison(driver, player1_name, player2_name):
@@ -291,118 +581,28 @@ def select_players_for_comparison(driver, player1_name, player2_name):
         
         # Navigate to players comparison page
         driver.get(PLAYER_COMPARISON_URL)
-        time.sleep(3)  # Wait for page to load
         
         # Save initial page for debugging
         save_page_source(driver, "players_comparison_page_initial")
         
         # Step 1: Click on the first "Click to Add Player" button
-        try:
-            first_add_player = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, ".ih-tcomp-tsel-left"))
-            )
-            first_add_player.click()
-            time.sleep(1)
-        except Exception as e:
-            print(f"{Fore.RED}Error clicking first player selector: {str(e)}{Style.RESET_ALL}")
-            
-            # Try alternative selector
-            try:
-                first_add_player = driver.find_element(By.XPATH, "//div[contains(@class, 'ih-tcomp-tsel-left')]")
-                first_add_player.click()
-                time.sleep(1)
-            except Exception as e2:
-                print(f"{Fore.RED}Error with alternative first player selector: {str(e2)}{Style.RESET_ALL}")
-                return False
+        if not click_selector(driver, LEFT_SLOT_LOCATOR, LEFT_SLOT_FALLBACK_LOCATOR, "first player"):
+            return False
         
         # Step 2: Search for the first player
-        try:
-            search_input = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "input.ih-pl-srch"))
-            )
-            search_input.clear()
-            search_input.send_keys(player1_name)
-            time.sleep(2)  # Wait for search results
-            
-            # Click on the matching player
-            player_elements = driver.find_elements(By.CSS_SELECTOR, ".ih-td-filter-list li")
-            
-            first_player_found = False
-            for player in player_elements:
-                if player1_name.lower() in player.text.lower():
-                    scroll_to_element(driver, player)
-                    player.click()
-                    first_player_found = True
-                    print(f"{Fore.GREEN}Selected first player: {player.text}{Style.RESET_ALL}")
-                    time.sleep(1)
-                    break
-            
-            if not first_player_found:
-                print(f"{Fore.RED}Could not find first player: {player1_name} in search results{Style.RESET_ALL}")
-                return False
-                
-        except Exception as e:
-            print(f"{Fore.RED}Error searching for first player: {str(e)}{Style.RESET_ALL}")
+        if not search_and_select_player(driver, player1_name, "first"):
             return False
         
         # Step 3: Click on the second "Click to Add Player" button
-        try:
-            second_add_player = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, ".ih-tcomp-tsel-right"))
-            )
-            second_add_player.click()
-            time.sleep(1)
-        except Exception as e:
-            print(f"{Fore.RED}Error clicking second player selector: {str(e)}{Style.RESET_ALL}")
-            
-            # Try alternative selector
-            try:
-                second_add_player = driver.find_element(By.XPATH, "//div[contains(@class, 'ih-tcomp-tsel-right')]")
-                second_add_player.click()
-                time.sleep(1)
-            except Exception as e2:
-                print(f"{Fore.RED}Error with alternative second player selector: {str(e2)}{Style.RESET_ALL}")
-                return False
+        if not click_selector(driver, RIGHT_SLOT_LOCATOR, RIGHT_SLOT_FALLBACK_LOCATOR, "second player"):
+            return False
         
         # Step 4: Search for the second player
-        try:
-            search_input = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "input.ih-pl-srch"))
-            )
-            search_input.clear()
-            search_input.send_keys(player2_name)
-            time.sleep(2)  # Wait for search results
-            
-            # Click on the matching player
-            player_elements = driver.find_elements(By.CSS_SELECTOR, ".ih-td-filter-list li")
-            
-            second_player_found = False
-            for player in player_elements:
-                if player2_name.lower() in player.text.lower():
-                    scroll_to_element(driver, player)
-                    player.click()
-                    second_player_found = True
-                    print(f"{Fore.GREEN}Selected second player: {player.text}{Style.RESET_ALL}")
-                    time.sleep(2)  # Wait longer for comparison to load
-                    break
-            
-            if not second_player_found:
-                print(f"{Fore.RED}Could not find second player: {player2_name} in search results{Style.RESET_ALL}")
-                return False
-                
-        except Exception as e:
-            print(f"{Fore.RED}Error searching for second player: {str(e)}{Style.RESET_ALL}")
+        if not search_and_select_player(driver, player2_name, "second"):
             return False
         
         # Step 5: Wait for comparison data to load and scroll through it
-        print(f"{Fore.CYAN}Waiting for comparison data to load...{Style.RESET_ALL}")
-        time.sleep(3)
-        
-        # Scroll through the page to ensure all data is loaded
-        scroll_down_page(driver, 300)  # Initial scroll to see first part of comparison data
-        time.sleep(1)
-        
-        scroll_to_bottom(driver)  # Then scroll to the bottom to load everything
+        wait_for_comparison_table(driver)
         
         # Save the comparison page after scrolling
         save_page_source(driver, f"player_comparison_{player1_name.replace(' ', '_')}_vs_{player2_name.replace(' ', '_')}_after_scroll")
@@ -411,112 +611,190 @@ def select_players_for_comparison(driver, player1_name, player2_name):
     
     except Exception as e:
         print(f"{Fore.RED}Error selecting players for comparison: {str(e)}{Style.RESET_ALL}")
-        save_page_source(driver, f"error_player_comparison_{player1_name.replace(' ', '_')}_vs_{player2_name.replace(' ', '_')}")
+        save_page_source(driver, f"error_player_comparison_{player1_name.replace(' ', '_')}_vs_{player2_name.replace(' ', '_')}", on_error=True)
         return False
 
 def extract_comparison_data(driver, entity_type="team"):
     """
     Extract comparison data from the current page
     """
-    # Wait a moment to ensure page is fully loaded after scrolling
-    time.sleep(2)
-    
-    # 1. Try to identify the comparison table and headers
     try:
-        comparison_table = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, ".ih-comparison-table"))
-        )
-        
-        # Get table headers
-        headers = []
-        header_elements = comparison_table.find_elements(By.CSS_SELECTOR, "th")
-        for header in header_elements:
-            headers.append(header.text.strip())
-        
-        if len(headers) < 3:
-            print(f"{Fore.YELLOW}Headers not found or incomplete, using default headers{Style.RESET_ALL}")
-            headers = ["Metric", "Entity 1", "Entity 2"]
-        
-        # 2. Extract all rows
-        comparison_data = []
-        rows = comparison_table.find_elements(By.CSS_SELECTOR, "tbody tr")
-        
-        for row in rows:
-            cells = row.find_elements(By.CSS_SELECTOR, "td")
-            if len(cells) >= 3:
-                row_data = {
-                    headers[0]: cells[0].text.strip(),
-                    headers[1]: cells[1].text.strip(),
-                    headers[2]: cells[2].text.strip()
-                }
-                comparison_data.append(row_data)
+        get_wait(driver).until(EC.presence_of_element_located(COMPARISON_TABLE_LOCATOR))
+        
+        # Read every header and cell in a single script call instead of one call per cell
+        table_data = driver.execute_script(EXTRACT_TABLE_SCRIPT)
+        if table_data:
+            comparison_data = build_comparison_rows(table_data["headers"], table_data["rows"])
+        else:
+            # Fall back to parsing the page source
+            comparison_data = parse_comparison_table(driver.page_source)
+            if comparison_data is None:
+                print(f"{Fore.RED}No comparison table found in HTML{Style.RESET_ALL}")
+                return []
         
         print(f"{Fore.GREEN}Extracted {len(comparison_data)} comparison metrics{Style.RESET_ALL}")
         return comparison_data
         
     except Exception as e:
         print(f"{Fore.RED}Error extracting comparison data from page: {str(e)}{Style.RESET_ALL}")
-        
-        # Try alternative approach with BeautifulSoup
-        try:
-            html_content = driver.page_source
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Find the comparison table
-            table = soup.select_one('.ih-comparison-table')
-            if not table:
-                print(f"{Fore.RED}No comparison table found in HTML{Style.RESET_ALL}")
-                return []
-            
-            # Get headers
-            headers = []
-            for th in table.select('th'):
-                headers.append(th.text.strip())
-            
-            if len(headers) < 3:
-                print(f"{Fore.YELLOW}Not enough headers found in table, using default headers{Style.RESET_ALL}")
-                headers = ["Metric", "Entity 1", "Entity 2"]
-            
-            # Extract rows
-            comparison_data = []
-            for tr in table.select('tbody tr'):
-                cells = tr.select('td')
-                if len(cells) >= 3:
-                    row_data = {
-                        headers[0]: cells[0].text.strip(),
-                        headers[1]: cells[1].text.strip(),
-                        headers[2]: cells[2].text.strip()
-                    }
-                    comparison_data.append(row_data)
-            
-            print(f"{Fore.GREEN}Extracted {len(comparison_data)} comparison metrics with BeautifulSoup{Style.RESET_ALL}")
-            return comparison_data
-            
-        except Exception as bs_error:
-            print(f"{Fore.RED}Error extracting with BeautifulSoup: {str(bs_error)}{Style.RESET_ALL}")
-            return []
+        return []
 
-def scrape_team_comparison(driver, team1_code, team2_code):
+def build_comparison_rows(headers, rows):
     """
-    Scrape comparison data for a specific team pair
+    Turn table headers and rows of cell texts into a list of row dictionaries
+    """
+    if len(headers) < 3:
+        print(f"{Fore.YELLOW}Not enough headers found in table, using default headers{Style.RESET_ALL}")
+        headers = ["Metric", "Entity 1", "Entity 2"]
+    
+    return [dict(zip(headers[:3], cells[:3])) for cells in rows if len(cells) >= 3]
+
+def parse_comparison_table(html_content):
+    """
+    Parse the comparison table rows out of an HTML document or fragment with lxml
+    
+    Returns None if the HTML has no comparison table
+    """
+    tree = lxml.html.fromstring(html_content)
+    
+    # Find the comparison table
+    tables = tree.xpath(COMPARISON_TABLE_XPATH)
+    if not tables:
+        return None
+    table = tables[0]
+    
+    headers = [th.text_content().strip() for th in table.iter('th')]
+    rows = [[td.text_content().strip() for td in tr.xpath('./td')] for tr in table.xpath('.//tbody//tr')]
+    
+    return build_comparison_rows(headers, rows)
+
+def get_team_comparison_via_api(team1_code, team2_code):
+    """
+    Get team comparison data from the endpoint behind the comparison page
+    
+    This avoids the browser entirely; returns None if the API has no usable data
     """
     try:
-        print(f"{Fore.CYAN}Scraping comparison for {team1_code} vs {team2_code}{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}Trying to get team comparison data via API for {team1_code} vs {team2_code}...{Style.RESET_ALL}")
         
-        # Step 1: Select teams for comparison
-        teams_selected = select_teams_for_comparison(driver, team1_code, team2_code)
+        response = SESSION.get(TEAM_COMPARISON_API_URL, params={'team_one': team1_code, 'team_two': team2_code}, timeout=15)
         
-        if not teams_selected:
-            print(f"{Fore.RED}Failed to select teams for comparison{Style.RESET_ALL}")
+        if response.status_code != 200:
+            print(f"{Fore.YELLOW}API request failed with status code {response.status_code}{Style.RESET_ALL}")
             return None
         
-        # Step 2: Extract comparison data
-        comparison_data = extract_comparison_data(driver, "team")
+        data = response.json()
+        if not data.get('status') or not data.get('html'):
+            print(f"{Fore.YELLOW}API returned status false or no HTML data{Style.RESET_ALL}")
+            return None
         
+        comparison_data = parse_comparison_table(data['html'])
         if not comparison_data:
-            print(f"{Fore.RED}No comparison data found for {team1_code} vs {team2_code}{Style.RESET_ALL}")
+            print(f"{Fore.YELLOW}No comparison table found in API response{Style.RESET_ALL}")
             return None
         
+        print(f"{Fore.GREEN}Extracted {len(comparison_data)} comparison metrics from API{Style.RESET_ALL}")
+        return comparison_data
+        
+    except Exception as e:
+        print(f"{Fore.YELLOW}Error in API comparison method: {str(e)}{Style.RESET_ALL}")
+        return None
+
+def get_team_comparison_path(team1_code, team2_code):
+    """
+    Get today's output path (without extension) for a team pair
+    """
+    timestamp = datetime.datetime.now().strftime('%Y%m%d')
+    return os.path.join(TEAM_COMPARISON_FOLDER, f"team_comparison_{team1_code}_vs_{team2_code}_{timestamp}")
+
+def get_player_comparison_path(player1_name, player2_name):
+    """
+    Get today's output path (without extension) for a player pair
+    """
+    safe_player1 = player1_name.replace(' ', '_').replace('/', '_')
+    safe_player2 = player2_name.replace(' ', '_').replace('/', '_')
+    timestamp = datetime.datetime.now().strftime('%Y%m%d')
+    return os.path.join(PLAYER_COMPARISON_FOLDER, f"player_comparison_{safe_player1}_vs_{safe_player2}_{timestamp}")
+
+def is_comparison_cached(filepath):
+    """
+    Check whether a comparison was already saved to disk within the cache TTL
+    """
+    json_filepath = f"{filepath}.json"
+    return os.path.exists(json_filepath) and time.time() - os.path.getmtime(json_filepath) < CACHE_TTL_SECONDS
+
+def load_cached_comparison(filepath):
+    """
+    Load a previously saved comparison, or return None if there is no fresh copy
+    """
+    if not is_comparison_cached(filepath):
+        return None
+    
+    try:
+        with open(f"{filepath}.json", 'r', encoding='utf-8') as f:
+            result = json.load(f)
+        print(f"{Fore.GREEN}Loaded cached comparison from {filepath}.json{Style.RESET_ALL}")
+        return result
+    except Exception as e:
+        print(f"{Fore.YELLOW}Could not load cached comparison {filepath}.json: {str(e)}{Style.RESET_ALL}")
+        return None
+
+def save_comparison_files(result, filepath, entity_type):
+    """
+    Save a comparison result as JSON and its comparison rows as CSV
+    """
+    json_filepath = f"{filepath}.json"
+    with open(json_filepath, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=4)
+    print(f"{Fore.GREEN}Saved {entity_type} comparison to {json_filepath}{Style.RESET_ALL}")
+    
+    comparison_data = result["comparison_data"]
+    csv_filepath = f"{filepath}.csv"
+    with open(csv_filepath, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=list(comparison_data[0].keys()))
+        writer.writeheader()
+        writer.writerows(comparison_data)
+    print(f"{Fore.GREEN}Saved {entity_type} comparison CSV to {csv_filepath}{Style.RESET_ALL}")
+
+def scrape_team_comparison(driver, team1_code, team2_code, use_api=True):
+    """
+    Scrape comparison data for a specific team pair
+    
+    The comparison API is tried first when use_api is set; the browser is only
+    used if the API has no data and a driver is given
+    """
+    try:
+        filepath = get_team_comparison_path(team1_code, team2_code)
+        
+        # Skip the browser entirely if this pair was already scraped recently
+        cached_result = load_cached_comparison(filepath)
+        if cached_result:
+            return cached_result
+        
+        # Step 1: Try the comparison API first, it needs no browser
+        comparison_data = get_team_comparison_via_api(team1_code, team2_code) if use_api else None
+        
+        if not comparison_data:
+            if driver is None:
+                print(f"{Fore.YELLOW}API had no data for {team1_code} vs {team2_code}, a browser is needed{Style.RESET_ALL}")
+                return None
+            
+            print(f"{Fore.CYAN}Scraping comparison for {team1_code} vs {team2_code}{Style.RESET_ALL}")
+            
+            # Step 2: Select teams for comparison in the browser
+            teams_selected = select_teams_for_comparison(driver, team1_code, team2_code)
+            
+            if not teams_selected:
+                print(f"{Fore.RED}Failed to select teams for comparison{Style.RESET_ALL}")
+                return None
+            
+            # Extract comparison data
+            comparison_data = extract_comparison_data(driver, "team")
+            
+            if not comparison_data:
+                print(f"{Fore.RED}No comparison data found for {team1_code} vs {team2_code}{Style.RESET_ALL}")
+                return None
+        
         # Step 3: Prepare result
         team1_name = TEAM_CODES.get(team1_code, team1_code)
         team2_name = TEAM_CODES.get(team2_code, team2_code)
@@ -531,19 +809,7 @@ def scrape_team_comparison(driver, team1_code, team2_code):
         }
         
         # Step 4: Save as JSON and CSV
-        timestamp = datetime.datetime.now().strftime('%Y%m%d')
-        filename = f"team_comparison_{team1_code}_vs_{team2_code}_{timestamp}"
-        
-        json_filepath = os.path.join(TEAM_COMPARISON_FOLDER, f"{filename}.json")
-        with open(json_filepath, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=4)
-        print(f"{Fore.GREEN}Saved team comparison to {json_filepath}{Style.RESET_ALL}")
-        
-        # Save as CSV
-        df = pd.DataFrame(comparison_data)
-        csv_filepath = os.path.join(TEAM_COMPARISON_FOLDER, f"{filename}.csv")
-        df.to_csv(csv_filepath, index=False)
-        print(f"{Fore.GREEN}Saved team comparison CSV to {csv_filepath}{Style.RESET_ALL}")
+        save_comparison_files(result, filepath, "team")
         
         return result
         
@@ -556,6 +822,13 @@ def scrape_player_comparison(driver, player1_name, player2_name):
     Scrape comparison data for a specific player pair
     """
     try:
+        filepath = get_player_comparison_path(player1_name, player2_name)
+        
+        # Skip the browser entirely if this pair was already scraped recently
+        cached_result = load_cached_comparison(filepath)
+        if cached_result:
+            return cached_result
+        
         print(f"{Fore.CYAN}Scraping comparison for {player1_name} vs {player2_name}{Style.RESET_ALL}")
         
         # Step 1: Select players for comparison
@@ -581,22 +854,7 @@ def scrape_player_comparison(driver, player1_name, player2_name):
         }
         
         # Step 4: Save as JSON and CSV
-        safe_player1 = player1_name.replace(' ', '_').replace('/', '_')
-        safe_player2 = player2_name.replace(' ', '_').replace('/', '_')
-        timestamp = datetime.datetime.now().strftime('%Y%m%d')
-        
-        filename = f"player_comparison_{safe_player1}_vs_{safe_player2}_{timestamp}"
-        
-        json_filepath = os.path.join(PLAYER_COMPARISON_FOLDER, f"{filename}.json")
-        with open(json_filepath, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=4)
-        print(f"{Fore.GREEN}Saved player comparison to {json_filepath}{Style.RESET_ALL}")
-        
-        # Save as CSV
-        df = pd.DataFrame(comparison_data)
-        csv_filepath = os.path.join(PLAYER_COMPARISON_FOLDER, f"{filename}.csv")
-        df.to_csv(csv_filepath, index=False)
-        print(f"{Fore.GREEN}Saved player comparison CSV to {csv_filepath}{Style.RESET_ALL}")
+        save_comparison_files(result, filepath, "player")
         
         return result
         
@@ -604,7 +862,7 @@ def scrape_player_comparison(driver, player1_name, player2_name):
         print(f"{Fore.RED}Error in player comparison process: {str(e)}{Style.RESET_ALL}")
         return None
 
-def main():
+def main(fresh=False):
     """
     Main function to run the IPL comparison scraper
     """
@@ -615,49 +873,60 @@ def main():
     start_time = datetime.datetime.now()
     print(f"Scraping started at: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
     
-    # Setup driver
-    driver = setup_driver()
+    # List of team pairs to compare
+    team_comparison_pairs = [
+        ("CSK", "MI"),   # Chennai Super Kings vs Mumbai Indians
+        ("RCB", "KKR"),  # Royal Challengers Bengaluru vs Kolkata Knight Riders
+        ("SRH", "RR")    # Sunrisers Hyderabad vs Rajasthan Royals
+    ]
     
-    if driver is None:
+    # List of player pairs to compare
+    player_comparison_pairs = [
+        ("MS Dhoni", "Virat Kohli"),
+        ("Rohit Sharma", "KL Rahul"),
+        ("Jasprit Bumrah", "Kagiso Rabada")
+    ]
+    
+    # Team pairs are served from the cache or the comparison API first, without a browser
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(len(team_comparison_pairs), 1)) as executor:
+        team_results = list(executor.map(lambda pair: scrape_team_comparison(None, *pair), team_comparison_pairs))
+    team_comparisons = [result for result in team_results if result]
+    browser_team_pairs = [pair for pair, result in zip(team_comparison_pairs, team_results) if not result]
+    
+    # Pairs already scraped within the cache TTL don't need a browser
+    pending_pairs_count = len(browser_team_pairs) + sum(
+        not is_comparison_cached(get_player_comparison_path(*pair)) for pair in player_comparison_pairs
+    )
+    
+    # Setup a small pool of drivers, one per concurrent scrape
+    pool_size = min(DRIVER_POOL_SIZE, pending_pairs_count)
+    driver_pool = create_driver_pool(pool_size, fresh) if pool_size else queue.Queue()
+    
+    if pool_size and driver_pool.empty():
         print(f"{Fore.RED}Failed to set up WebDriver. Exiting.{Style.RESET_ALL}")
         return
     
     try:
-        # List of team pairs to compare
-        team_comparison_pairs = [
-            ("CSK", "MI"),   # Chennai Super Kings vs Mumbai Indians
-            ("RCB", "KKR"),  # Royal Challengers Bengaluru vs Kolkata Knight Riders
-            ("SRH", "RR")    # Sunrisers Hyderabad vs Rajasthan Royals
-        ]
-        
-        # List of player pairs to compare
-        player_comparison_pairs = [
-            ("MS Dhoni", "Virat Kohli"),
-            ("Rohit Sharma", "KL Rahul"),
-            ("Jasprit Bumrah", "Kagiso Rabada")
-        ]
-        
-        # Scrape team comparisons
-        team_comparisons = []
-        for team1_code, team2_code in team_comparison_pairs:
-            result = scrape_team_comparison(driver, team1_code, team2_code)
-            if result:
-                team_comparisons.append(result)
-                
-            # Reset the driver state
-            driver.delete_all_cookies()
-            time.sleep(1)
-        
-        # Scrape player comparisons
-        player_comparisons = []
-        for player1_name, player2_name in player_comparison_pairs:
-            result = scrape_player_comparison(driver, player1_name, player2_name)
-            if result:
-                player_comparisons.append(result)
-                
-            # Reset the driver state
-            driver.delete_all_cookies()
-            time.sleep(1)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(driver_pool.qsize(), 1)) as executor:
+            def submit_scrape(scrape_function, path_function, pair):
+                # Cached pairs are loaded directly without borrowing a driver
+                if is_comparison_cached(path_function(*pair)):
+                    return executor.submit(scrape_function, None, *pair)
+                return executor.submit(scrape_with_pooled_driver, driver_pool, scrape_function, pair)
+            
+            # Scrape the remaining comparisons concurrently, each worker using its own driver
+            scrape_team_in_browser = functools.partial(scrape_team_comparison, use_api=False)
+            team_futures = [
+                submit_scrape(scrape_team_in_browser, get_team_comparison_path, pair)
+                for pair in browser_team_pairs
+            ]
+            player_futures = [
+                submit_scrape(scrape_player_comparison, get_player_comparison_path, pair)
+                for pair in player_comparison_pairs
+            ]
+            
+            team_comparisons += [result for result in (future.result() for future in team_futures) if result]
+            player_comparisons = [result for result in (future.result() for future in player_futures) if result]
         
         # Create overall summary
         summary = {
@@ -679,10 +948,8 @@ def main():
         print(f"{Fore.RED}Error in main process: {str(e)}{Style.RESET_ALL}")
     
     finally:
-        # Close the driver
-        if driver:
-            driver.quit()
-            print(f"{Fore.CYAN}Closed WebDriver{Style.RESET_ALL}")
+        # Close all pooled drivers
+        close_driver_pool(driver_pool, fresh)
     
     end_time = datetime.datetime.now()
     print(f"\n{Fore.CYAN}======================================{Style.RESET_ALL}")
@@ -691,4 +958,8 @@ def main():
     print(f"{Fore.CYAN}======================================{Style.RESET_ALL}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Scrape IPL team and player comparison data")
+    parser.add_argument('--fresh', action='store_true',
+                        help="start new browsers and close them at the end instead of reusing running ones")
+    args = parser.parse_args()
+    main(fresh=args.fresh)
\ No newline at end of file
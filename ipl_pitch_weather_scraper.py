@@ -12,28 +12,67 @@ Usage:
     python ipl_pitch_weather_scraper.py
 
 Dependencies:
-    - requests
-    - beautifulsoup4
-    - pandas
+    - aiohttp
+    - lxml
     - colorama
     - python-dotenv
 """
 
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+import aiohttp
+import asyncio
+import lxml.html
+import csv
 import datetime
 import os
 import json
-import time
 import re
+import time
+import hashlib
+from urllib.parse import urlencode
 from colorama import init, Fore, Style
-import concurrent.futures
 from dotenv import load_dotenv
 
 # Load environment variables from .env file - add debugging
 load_dotenv()
 OPENWEATHER_API_KEY = os.getenv("OPENWEATHER_API_KEY")
+
+# Run date, computed once for record timestamps and output file names
+TODAY_STR = datetime.date.today().isoformat()
+TODAY_FILE = datetime.date.today().strftime('%Y%m%d')
+
+# Default and fallback report records; callers fill in the venue-specific keys (None here)
+PITCH_REPORT_TEMPLATE = {
+    "venue": None,
+    "city": None,
+    "pitch_report": "Not available",
+    "average_score": "Not available",
+    "highest_score": "Not available",
+    "lowest_score": "Not available",
+    "characteristics": "Not available",
+    "source": "Cricbuzz",
+    "source_url": None,
+    "last_updated": TODAY_STR
+}
+
+WEATHER_ERROR_TEMPLATE = {
+    "city": None,
+    "state": None,
+    "current_temp": "Error",
+    "current_condition": "Error",
+    "humidity": "Error",
+    "wind_speed": "Error",
+    "forecast": "Error",
+    "last_updated": TODAY_STR
+}
+
+WEATHER_NO_API_KEY_TEMPLATE = {
+    **WEATHER_ERROR_TEMPLATE,
+    "current_temp": "API key not configured",
+    "current_condition": "API key not configured",
+    "humidity": "API key not configured",
+    "wind_speed": "API key not configured",
+    "forecast": "API key not configured"
+}
 print(f"{Fore.YELLOW}API Key loaded: {OPENWEATHER_API_KEY[:5]}...{OPENWEATHER_API_KEY[-5:] if OPENWEATHER_API_KEY else 'None'}{Style.RESET_ALL}")
 
 # Initialize colorama for colored console output
@@ -44,7 +83,8 @@ FOLDERS = {
     'pitch_reports': 'pitch_reports',
     'weather_reports': 'weather_reports',
     'combined_reports': 'combined_reports',
-    'debug_files': 'debug_files'
+    'debug_files': 'debug_files',
+    'http_cache': '.http_cache'
 }
 
 # IPL 2025 venues and their locations with direct Cricbuzz links
@@ -129,29 +169,166 @@ IPL_VENUES = [
     }
 ]
 
-# Get API key from environment variables
-# OPENWEATHER_API_KEY = os.getenv("OPENWEATHER_API_KEY")
+# Coordinates of the venue cities, used for the OpenWeather requests
+VENUE_COORDS = {
+    "Kolkata": (22.5726, 88.3639),
+    "Bengaluru": (12.9716, 77.5946),
+    "Chennai": (13.0827, 80.2707),
+    "Mumbai": (19.0760, 72.8777),
+    "Delhi": (28.6139, 77.2090),
+    "Hyderabad": (17.3850, 78.4867),
+    "Ahmedabad": (23.0225, 72.5714),
+    "Lucknow": (26.8467, 80.9462),
+    "Jaipur": (26.9124, 75.7873),
+    "Guwahati": (26.1445, 91.7362),
+    "Visakhapatnam": (17.6868, 83.2185),
+    "Dharamsala": (32.2190, 76.3234),
+    "Mohali": (30.7046, 76.7179)
+}
+
+# OpenWeather endpoints
+ONE_CALL_URL = "https://api.openweathermap.org/data/3.0/onecall"
+CURRENT_WEATHER_URL = "https://api.openweathermap.org/data/2.5/weather"
+FORECAST_URL = "https://api.openweathermap.org/data/2.5/forecast"
+
+# Time of day used to pick one entry per day from the 3-hourly forecast
+NOON = datetime.time(12, 0)
+
+# Cleared on the first 401/403 from One Call, after which only the 2.5 endpoints are used
+ONE_CALL_AVAILABLE = True
 
 # Common headers for HTTP requests
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
 }
 
+# Set IPL_DEBUG=1 to save the fetched Cricbuzz pages to debug_files
+DEBUG = os.environ.get("IPL_DEBUG", "0") == "1"
+
+# Maximum number of concurrent requests to Cricbuzz and OpenWeather
+CRICBUZZ_MAX_CONCURRENCY = 4
+OPENWEATHER_MAX_CONCURRENCY = 8
+
+# Keywords (matched as substrings of the lowercased description) for each pitch characteristic
+CHARACTERISTIC_KEYWORDS = {
+    "Batting friendly": ["batting friendly", "batting paradise", "flat", "high scoring", "high-scoring", "run fest", "run-fest", "batting surface", "batsmen", "batters"],
+    "Assists spin": ["spin", "turn", "slow"],
+    "Good for pacers": ["pace", "fast", "bounce", "bouncy", "seam", "swing"],
+    "Slow and low": ["slow and low", "low bounce", "tired", "worn"],
+    "Balanced for bat and ball": ["even contest", "balanced", "fair contest", "even battle"]
+}
+
+# Every characteristic implied by a keyword, including those of shorter keywords it contains
+# (e.g. "slow and low" also implies "Assists spin" through "slow")
+KEYWORD_CHARACTERISTICS = {
+    keyword: {name for name, terms in CHARACTERISTIC_KEYWORDS.items() if any(term in keyword for term in terms)}
+    for keywords in CHARACTERISTIC_KEYWORDS.values() for keyword in keywords
+}
+
+# Single scan over the description: the lookahead tries every position and
+# captures the longest keyword starting there
+CHARACTERISTIC_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(keyword) for keyword in sorted(KEYWORD_CHARACTERISTICS, key=len, reverse=True)) + "))"
+)
+
+# Request timeouts, so a hung server cannot stall the whole run
+HTTP_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=5, sock_read=15)
+
+# Largest response body accepted from Cricbuzz or OpenWeather
+MAX_RESPONSE_BYTES = 2 * 1024 * 1024
+RESPONSE_CHUNK_SIZE = 64 * 1024
+
+# How long cached HTTP responses stay fresh, in seconds
+CRICBUZZ_CACHE_TTL = 7 * 24 * 60 * 60
+CURRENT_WEATHER_CACHE_TTL = 10 * 60
+FORECAST_CACHE_TTL = 60 * 60
+
 
 def create_folders():
     """Create the necessary folder structure if it doesn't exist"""
-    for folder in FOLDERS.values():
+    for key, folder in FOLDERS.items():
+        if key == 'debug_files' and not DEBUG:
+            continue
         if not os.path.exists(folder):
             os.makedirs(folder)
             print(f"{Fore.GREEN}Created folder: {folder}{Style.RESET_ALL}")
 
 
-def fetch_cricbuzz_pitch_report(venue):
+async def cached_get(session, url, ttl, params=None):
+    """
+    GET a URL, serving the body from the on-disk HTTP cache while it is fresh
+    
+    Args:
+        session (aiohttp.ClientSession): Shared HTTP session
+        url (str): URL to fetch
+        ttl (int): Seconds a cached response stays fresh
+        params (dict, optional): Query parameters
+    
+    Returns:
+        str: Response body
+    
+    Raises:
+        aiohttp.ClientResponseError: If the server returns an error status
+        ValueError: If the response is larger than MAX_RESPONSE_BYTES
+    """
+    cache_key = url + "?" + urlencode(sorted((params or {}).items()))
+    cache_file = os.path.join(FOLDERS['http_cache'], hashlib.sha1(cache_key.encode("utf-8")).hexdigest())
+    
+    if os.path.exists(cache_file) and time.time() - os.path.getmtime(cache_file) < ttl:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            return f.read()
+    
+    async with session.get(url, params=params) as response:
+        response.raise_for_status()
+        
+        # Refuse oversized responses before downloading them, and cap those without a Content-Length
+        if response.content_length is not None and response.content_length > MAX_RESPONSE_BYTES:
+            raise ValueError(f"Response too large ({response.content_length} bytes) from {url}")
+        chunks = []
+        size = 0
+        async for chunk in response.content.iter_chunked(RESPONSE_CHUNK_SIZE):
+            size += len(chunk)
+            if size > MAX_RESPONSE_BYTES:
+                raise ValueError(f"Response larger than {MAX_RESPONSE_BYTES} bytes from {url}")
+            chunks.append(chunk)
+        body = b"".join(chunks).decode(response.charset or "utf-8", errors="replace")
+    
+    # Only successful responses are cached
+    with open(cache_file, "w", encoding="utf-8") as f:
+        f.write(body)
+    
+    return body
+
+
+def stripped_text(element):
+    """
+    Join the element's text nodes with surrounding whitespace stripped from each
+    """
+    return "".join(text.strip() for text in element.xpath('.//text()'))
+
+
+def previous_sibling_text(element):
+    """
+    Return the text of the node just before an element: the text between
+    them if there is any, otherwise the previous element's text content
+    """
+    previous = element.getprevious()
+    text = previous.tail if previous is not None else element.getparent().text
+    if text:
+        return text
+    if previous is None:
+        return ""
+    return previous.text_content()
+
+
+async def fetch_cricbuzz_pitch_report(venue, session, semaphore):
     """
     Fetch pitch report from Cricbuzz for a specific venue using direct URL
     
     Args:
         venue (dict): Venue dictionary containing name, city, and cricbuzz_url
+        session (aiohttp.ClientSession): Shared HTTP session
+        semaphore (asyncio.Semaphore): Limits concurrent requests to Cricbuzz
     
     Returns:
         dict: Pitch report details
@@ -164,51 +341,31 @@ def fetch_cricbuzz_pitch_report(venue):
     
     try:
         # Access the direct Cricbuzz URL
-        response = requests.get(cricbuzz_url, headers=HEADERS)
-        response.raise_for_status()
+        async with semaphore:
+            html = await cached_get(session, cricbuzz_url, CRICBUZZ_CACHE_TTL)
         
         # Save HTML for debugging
-        debug_filename = os.path.join(FOLDERS['debug_files'], f"pitch_{venue_name.replace(' ', '_')}_{city}_cricbuzz.html")
-        with open(debug_filename, "w", encoding="utf-8") as f:
-            f.write(response.text)
+        if DEBUG:
+            debug_filename = os.path.join(FOLDERS['debug_files'], f"pitch_{venue_name.replace(' ', '_')}_{city}_cricbuzz.html")
+            with open(debug_filename, "w", encoding="utf-8") as f:
+                f.write(html)
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        tree = lxml.html.fromstring(html)
         
         # Initialize the pitch data dictionary
-        pitch_data = {
-            "venue": venue_name,
-            "city": city,
-            "pitch_report": "Not available",
-            "average_score": "Not available",
-            "highest_score": "Not available",
-            "lowest_score": "Not available", 
-            "characteristics": "Not available",
-            "source": "Cricbuzz",
-            "source_url": cricbuzz_url,
-            "last_updated": datetime.datetime.now().strftime('%Y-%m-%d')
-        }
+        pitch_data = {**PITCH_REPORT_TEMPLATE, "venue": venue_name, "city": city, "source_url": cricbuzz_url}
         
-        # Look for the venue description paragraphs
+        # Find the venue description and pitch information in one pass over the paragraphs
         venue_description = ""
-        # Find the paragraph with "Venue Description" heading
-        venue_desc_section = soup.find('p', string=lambda text: text and 'Venue Description' in text)
-        if venue_desc_section:
-            # Get all the content from this paragraph
-            venue_description = venue_desc_section.get_text(strip=True)
-        
-        # If we couldn't find it that way, try looking for all paragraphs
-        if not venue_description:
-            paragraphs = soup.find_all('p')
-            for p in paragraphs:
-                if 'Venue Description' in p.get_text() or 'venue description' in p.get_text().lower():
-                    venue_description = p.get_text(strip=True)
-                    break
-        
-        # Look for pitch information specifically
         pitch_info = ""
-        for p in soup.find_all('p'):
-            if 'How does the pitch play?' in p.get_text() or 'pitch' in p.get_text().lower():
-                pitch_info = p.get_text(strip=True)
+        for p in tree.iter('p'):
+            text = p.text_content().lower()
+            if not venue_description and 'venue description' in text:
+                venue_description = stripped_text(p)
+            # Also covers the "How does the pitch play?" section
+            if not pitch_info and 'pitch' in text:
+                pitch_info = stripped_text(p)
+            if venue_description and pitch_info:
                 break
         
         # Combine the information
@@ -218,16 +375,17 @@ def fetch_cricbuzz_pitch_report(venue):
             pitch_data["pitch_report"] += "\n" + pitch_info
         
         # Get stats from tables
-        tables = soup.find_all('table', class_='table')
+        tables = tree.xpath("//table[contains(concat(' ', normalize-space(@class), ' '), ' table ')]")
         for table in tables:
             # Look for ODI or T20 stats
-            if 'STATS - ODI' in str(table.previous_sibling) or 'STATS - T20' in str(table.previous_sibling):
-                rows = table.find_all('tr')
+            sibling_text = previous_sibling_text(table)
+            if 'STATS - ' in sibling_text and ('STATS - ODI' in sibling_text or 'STATS - T20' in sibling_text):
+                rows = table.iter('tr')
                 for row in rows:
-                    cols = row.find_all('td')
+                    cols = row.xpath('.//td')
                     if len(cols) >= 2:
-                        header = cols[0].get_text(strip=True)
-                        value = cols[1].get_text(strip=True)
+                        header = stripped_text(cols[0])
+                        value = stripped_text(cols[1])
                         
                         if 'Average 1st Inns scores' in header:
                             pitch_data["average_score"] = f"Average 1st innings score: {value}"
@@ -238,23 +396,10 @@ def fetch_cricbuzz_pitch_report(venue):
         
         # Extract pitch characteristics from the venue description
         pitch_desc = pitch_data["pitch_report"].lower()
-        characteristics = []
-        
-        # Check for various pitch characteristics in the description
-        if any(term in pitch_desc for term in ["batting friendly", "batting paradise", "flat", "high scoring", "high-scoring", "run fest", "run-fest", "batting surface", "batsmen", "batters"]):
-            characteristics.append("Batting friendly")
-        
-        if any(term in pitch_desc for term in ["spin", "spinner", "spinners", "turning", "turn", "slow"]):
-            characteristics.append("Assists spin")
-        
-        if any(term in pitch_desc for term in ["pace", "fast", "bounce", "bouncy", "seam", "seaming", "swing"]):
-            characteristics.append("Good for pacers")
-        
-        if any(term in pitch_desc for term in ["slow and low", "low bounce", "tired", "worn"]):
-            characteristics.append("Slow and low")
-        
-        if any(term in pitch_desc for term in ["even contest", "balanced", "fair contest", "even battle"]):
-            characteristics.append("Balanced for bat and ball")
+        found = set()
+        for match in CHARACTERISTIC_PATTERN.finditer(pitch_desc):
+            found.update(KEYWORD_CHARACTERISTICS[match.group(1)])
+        characteristics = [name for name in CHARACTERISTIC_KEYWORDS if name in found]
         
         if characteristics:
             pitch_data["characteristics"] = ", ".join(characteristics)
@@ -269,155 +414,210 @@ def fetch_cricbuzz_pitch_report(venue):
     except Exception as e:
         print(f"{Fore.RED}Error fetching pitch report for {venue_name}: {str(e)}{Style.RESET_ALL}")
         return {
+            **PITCH_REPORT_TEMPLATE,
             "venue": venue_name,
             "city": city,
             "pitch_report": f"Error fetching data: {str(e)}",
-            "average_score": "Not available",
-            "highest_score": "Not available",
-            "lowest_score": "Not available",
-            "characteristics": "Not available",
-            "source": "Cricbuzz",
-            "source_url": cricbuzz_url,
-            "last_updated": datetime.datetime.now().strftime('%Y-%m-%d')
+            "source_url": cricbuzz_url
         }
 
 
-def fetch_weather_data(city, state, country="India"):
+def parse_one_call_weather(data):
+    """
+    Extract current weather and the next 5 days from a One Call 3.0 response
+    
+    Args:
+        data (dict): Parsed One Call JSON payload
+    
+    Returns:
+        dict: current_temp, current_condition, humidity, wind_speed and forecast
+    """
+    current = data.get("current", {})
+    
+    forecast = []
+    for day in data.get("daily", [])[1:6]:  # Next 5 days, daily[0] is today
+        forecast.append({
+            "date": datetime.datetime.fromtimestamp(day["dt"]).strftime('%Y-%m-%d'),
+            "temp": day["temp"]["day"],
+            "condition": day["weather"][0]["description"].capitalize(),
+            "humidity": day["humidity"]
+        })
+    
+    return {
+        "current_temp": current.get("temp", "N/A"),
+        "current_condition": current.get("weather", [{}])[0].get("description", "N/A").capitalize(),
+        "humidity": current.get("humidity", "N/A"),
+        "wind_speed": current.get("wind_speed", "N/A"),
+        "forecast": forecast
+    }
+
+
+def select_noon_forecasts(forecast_list):
+    """
+    Pick the 3-hourly forecast entry closest to noon for each of the next 5 days
+    
+    Args:
+        forecast_list (list): "list" entries of a 2.5 forecast response
+    
+    Returns:
+        list: Forecast dictionaries with date, temp, condition and humidity
+    """
+    # Find the entry closest to noon for each date in a single pass
+    closest_by_date = {}
+    for entry in forecast_list:
+        entry_dt = datetime.datetime.fromtimestamp(entry["dt"])
+        entry_date = entry_dt.date()
+        time_diff = abs((entry_dt - datetime.datetime.combine(entry_date, NOON)).total_seconds())
+        
+        closest = closest_by_date.get(entry_date)
+        if closest is None or time_diff < closest[0]:
+            closest_by_date[entry_date] = (time_diff, entry)
+    
+    forecast = []
+    current_date = datetime.date.today()
+    for i in range(1, 6):  # Next 5 days
+        target_date = current_date + datetime.timedelta(days=i)
+        if target_date in closest_by_date:
+            closest_entry = closest_by_date[target_date][1]
+            forecast.append({
+                "date": target_date.strftime('%Y-%m-%d'),
+                "temp": closest_entry["main"]["temp"],
+                "condition": closest_entry["weather"][0]["description"].capitalize(),
+                "humidity": closest_entry["main"]["humidity"]
+            })
+    
+    return forecast
+
+
+async def fetch_weather_from_v25(session, params):
+    """
+    Fetch current weather and forecast from the OpenWeather 2.5 endpoints
+    
+    Used when the API key has no One Call 3.0 subscription.
+    
+    Args:
+        session (aiohttp.ClientSession): Shared HTTP session
+        params (dict): Query parameters with lat, lon, units and appid
+    
+    Returns:
+        dict: current_temp, current_condition, humidity, wind_speed and forecast
+    """
+    weather_data = json.loads(await cached_get(session, CURRENT_WEATHER_URL, CURRENT_WEATHER_CACHE_TTL, params))
+    forecast_data = json.loads(await cached_get(session, FORECAST_URL, FORECAST_CACHE_TTL, params))
+    
+    return {
+        "current_temp": weather_data.get("main", {}).get("temp", "N/A"),
+        "current_condition": weather_data.get("weather", [{}])[0].get("description", "N/A").capitalize(),
+        "humidity": weather_data.get("main", {}).get("humidity", "N/A"),
+        "wind_speed": weather_data.get("wind", {}).get("speed", "N/A"),
+        "forecast": select_noon_forecasts(forecast_data.get("list", []))
+    }
+
+
+def format_forecast(days):
+    """
+    Format forecast days as one line per day for the CSV and HTML reports
+    
+    Args:
+        days (list): Forecast dictionaries with date, temp, condition and humidity
+    
+    Returns:
+        str: Newline-separated forecast summary
+    """
+    return "\n".join(f"{day['date']}: {day['temp']}°C, {day['condition']}, {day['humidity']}% humidity" for day in days)
+
+
+async def fetch_weather_data(session, semaphore, city, state, country="India"):
     """
     Fetch weather data for a specific location
     
+    Current weather and the daily forecast come from a single One Call 3.0
+    request using the venue coordinates. If the API key is not subscribed to
+    One Call 3.0, the 2.5 current weather and forecast endpoints are used.
+    
     Args:
+        session (aiohttp.ClientSession): Shared HTTP session
+        semaphore (asyncio.Semaphore): Limits concurrent requests to OpenWeather
         city (str): City name
         state (str): State name
         country (str, optional): Country name. Defaults to "India".
     
     Returns:
-        dict: Weather data
+        dict: Weather data, with the forecast already formatted as text
     """
+    global ONE_CALL_AVAILABLE
+    
     print(f"{Fore.CYAN}Fetching weather data for {city}, {state}...{Style.RESET_ALL}")
     
     api_key = OPENWEATHER_API_KEY
     if not api_key:
         print(f"{Fore.RED}OpenWeatherMap API key not found in environment variables{Style.RESET_ALL}")
+        return {**WEATHER_NO_API_KEY_TEMPLATE, "city": city, "state": state}
+    
+    try:
+        if city not in VENUE_COORDS:
+            raise ValueError(f"No coordinates configured for {city}")
+        
+        lat, lon = VENUE_COORDS[city]
+        params = {"lat": lat, "lon": lon, "units": "metric", "appid": api_key}
+        weather = None
+        
+        async with semaphore:
+            if ONE_CALL_AVAILABLE:
+                try:
+                    one_call_params = {**params, "exclude": "minutely,hourly,alerts"}
+                    body = await cached_get(session, ONE_CALL_URL, CURRENT_WEATHER_CACHE_TTL, one_call_params)
+                    weather = parse_one_call_weather(json.loads(body))
+                except aiohttp.ClientResponseError as e:
+                    if e.status not in (401, 403):
+                        raise
+                    # One Call 3.0 needs its own subscription; stop trying it for this run
+                    if ONE_CALL_AVAILABLE:
+                        print(f"{Fore.YELLOW}One Call 3.0 not available for this API key, using 2.5 endpoints{Style.RESET_ALL}")
+                    ONE_CALL_AVAILABLE = False
+            
+            if weather is None:
+                weather = await fetch_weather_from_v25(session, params)
+        
+        print(f"{Fore.GREEN}Successfully fetched weather for {city}{Style.RESET_ALL}")
+        
         return {
             "city": city,
             "state": state,
-            "current_temp": "API key not configured",
-            "current_condition": "API key not configured",
-            "humidity": "API key not configured",
-            "wind_speed": "API key not configured",
-            "forecast": "API key not configured",
-            "last_updated": datetime.datetime.now().strftime('%Y-%m-%d')
+            "current_temp": f"{weather['current_temp']}°C",
+            "current_condition": weather["current_condition"],
+            "humidity": f"{weather['humidity']}%",
+            "wind_speed": f"{weather['wind_speed']} m/s",
+            "forecast": format_forecast(weather["forecast"]),
+            "last_updated": TODAY_STR
         }
+        
+    except Exception as e:
+        print(f"{Fore.RED}Error fetching weather data for {city}: {str(e)}{Style.RESET_ALL}")
+        return {
+            **WEATHER_ERROR_TEMPLATE,
+            "city": city,
+            "state": state,
+            "current_temp": f"Error: Could not find weather data for {city}"
+        }
+
+
+def write_csv(filename, records):
+    """
+    Write a list of dictionaries to a CSV file
     
-    # Define alternative city names for problematic locations
-    city_alternatives = {
-        "Mumbai": ["Mumbai", "Bombay"],
-        "Chennai": ["Chennai", "Madras"],
-        "Bengaluru": ["Bengaluru", "Bangalore"],
-        "Kolkata": ["Kolkata", "Calcutta"],
-        "Visakhapatnam": ["Visakhapatnam", "Vizag", "Vishakhapatnam"],
-        "Delhi": ["Delhi", "New Delhi"]
-    }
-    
-    # Get the list of alternatives for this city (or just the city itself if not in the map)
-    alternatives = city_alternatives.get(city, [city])
-    
-    for alt_city in alternatives:
-        try:
-            # Try without including state first (more reliable for some cities)
-            weather_url = f"https://api.openweathermap.org/data/2.5/weather?q={alt_city}&appid={api_key}&units=metric"
-            print(f"{Fore.YELLOW}Trying: {weather_url}{Style.RESET_ALL}")
-            
-            response = requests.get(weather_url)
-            response.raise_for_status()
-            
-            weather_data = response.json()
-            
-            # Get forecast - also try without state
-            forecast_url = f"https://api.openweathermap.org/data/2.5/forecast?q={alt_city}&appid={api_key}&units=metric"
-            forecast_response = requests.get(forecast_url)
-            forecast_response.raise_for_status()
-            
-            forecast_data = forecast_response.json()
-            
-            # Process current weather
-            current_temp = weather_data.get("main", {}).get("temp", "N/A")
-            current_condition = weather_data.get("weather", [{}])[0].get("description", "N/A").capitalize()
-            humidity = weather_data.get("main", {}).get("humidity", "N/A")
-            wind_speed = weather_data.get("wind", {}).get("speed", "N/A")
-            
-            # Process forecast (next 5 days, once per day)
-            forecast_list = forecast_data.get("list", [])
-            forecast = []
-            
-            # Get one forecast entry per day (at noon)
-            current_date = datetime.datetime.now().date()
-            for i in range(1, 6):  # Next 5 days
-                target_date = current_date + datetime.timedelta(days=i)
-                target_datetime_str = f"{target_date.strftime('%Y-%m-%d')} 12:00:00"
-                
-                # Find the closest forecast entry to noon for each day
-                closest_entry = None
-                min_time_diff = float('inf')
-                
-                for entry in forecast_list:
-                    entry_dt = datetime.datetime.fromtimestamp(entry["dt"])
-                    entry_date = entry_dt.date()
-                    
-                    if entry_date == target_date:
-                        # Calculate time difference from noon
-                        noon = datetime.datetime.combine(entry_date, datetime.time(12, 0))
-                        time_diff = abs((entry_dt - noon).total_seconds())
-                        
-                        if time_diff < min_time_diff:
-                            min_time_diff = time_diff
-                            closest_entry = entry
-                
-                if closest_entry:
-                    forecast_date = datetime.datetime.fromtimestamp(closest_entry["dt"]).strftime('%Y-%m-%d')
-                    forecast_temp = closest_entry["main"]["temp"]
-                    forecast_condition = closest_entry["weather"][0]["description"].capitalize()
-                    forecast_humidity = closest_entry["main"]["humidity"]
-                    
-                    forecast.append({
-                        "date": forecast_date,
-                        "temp": forecast_temp,
-                        "condition": forecast_condition,
-                        "humidity": forecast_humidity
-                    })
-            
-            # If we get here, we found a working city name
-            print(f"{Fore.GREEN}Successfully fetched weather for {alt_city}{Style.RESET_ALL}")
-            
-            return {
-                "city": city,  # Return the original city name, not the alternative
-                "state": state,
-                "current_temp": f"{current_temp}°C",
-                "current_condition": current_condition,
-                "humidity": f"{humidity}%",
-                "wind_speed": f"{wind_speed} m/s",
-                "forecast": forecast,
-                "last_updated": datetime.datetime.now().strftime('%Y-%m-%d')
-            }
-            
-        except Exception as e:
-            print(f"{Fore.YELLOW}Failed with city name {alt_city}: {str(e)}{Style.RESET_ALL}")
-            # Continue to the next alternative
-            continue
+    Columns are the union of the record keys in first-seen order; missing
+    values are left empty.
     
-    # If we get here, all alternatives failed
-    print(f"{Fore.RED}Error fetching weather data for {city} and all alternatives{Style.RESET_ALL}")
-    return {
-        "city": city,
-        "state": state,
-        "current_temp": f"Error: Could not find weather data for {city}",
-        "current_condition": "Error",
-        "humidity": "Error",
-        "wind_speed": "Error",
-        "forecast": "Error",
-        "last_updated": datetime.datetime.now().strftime('%Y-%m-%d')
-    }
+    Args:
+        filename (str): Path to the CSV file
+        records (list): List of dictionaries to write
+    """
+    fieldnames = list(dict.fromkeys(key for record in records for key in record))
+    with open(filename, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, restval='')
+        writer.writeheader()
+        writer.writerows(records)
 
 
 def save_pitch_reports_to_csv(pitch_reports):
@@ -430,14 +630,10 @@ def save_pitch_reports_to_csv(pitch_reports):
     Returns:
         str: Path to the CSV file
     """
-    today = datetime.datetime.now().strftime('%Y%m%d')
-    filename = os.path.join(FOLDERS['pitch_reports'], f'ipl_pitch_reports_{today}.csv')
-    
-    # Create DataFrame
-    df = pd.DataFrame(pitch_reports)
+    filename = os.path.join(FOLDERS['pitch_reports'], f'ipl_pitch_reports_{TODAY_FILE}.csv')
     
     # Save to CSV
-    df.to_csv(filename, index=False)
+    write_csv(filename, pitch_reports)
     print(f"{Fore.GREEN}Pitch reports saved to {filename}{Style.RESET_ALL}")
     
     return filename
@@ -453,36 +649,21 @@ def save_weather_reports_to_csv(weather_reports):
     Returns:
         str: Path to the CSV file
     """
-    today = datetime.datetime.now().strftime('%Y%m%d')
-    filename = os.path.join(FOLDERS['weather_reports'], f'ipl_weather_reports_{today}.csv')
-    
-    # Process forecast to flatten it for CSV
-    processed_reports = []
-    for report in weather_reports:
-        processed_report = report.copy()
-        
-        # Convert forecast list to string representation for CSV
-        if isinstance(processed_report["forecast"], list):
-            forecast_str = ""
-            for day in processed_report["forecast"]:
-                forecast_str += f"{day['date']}: {day['temp']}°C, {day['condition']}, {day['humidity']}% humidity\n"
-            processed_report["forecast"] = forecast_str.strip()
-        
-        processed_reports.append(processed_report)
-    
-    # Create DataFrame
-    df = pd.DataFrame(processed_reports)
+    filename = os.path.join(FOLDERS['weather_reports'], f'ipl_weather_reports_{TODAY_FILE}.csv')
     
     # Save to CSV
-    df.to_csv(filename, index=False)
+    write_csv(filename, weather_reports)
     print(f"{Fore.GREEN}Weather reports saved to {filename}{Style.RESET_ALL}")
     
     return filename
 
 
-def save_combined_reports_to_csv(venues, pitch_reports, weather_reports):
+def build_combined_reports(venues, pitch_reports, weather_reports):
     """
-    Save combined pitch and weather reports to a CSV file
+    Merge pitch and weather data into one record per venue
+    
+    The records are shared by the combined CSV and the HTML report; the
+    forecast is already formatted text, so neither writer reformats it.
     
     Args:
         venues (list): List of venue dictionaries
@@ -490,11 +671,8 @@ def save_combined_reports_to_csv(venues, pitch_reports, weather_reports):
         weather_reports (list): List of weather report dictionaries
     
     Returns:
-        str: Path to the CSV file
+        list: List of combined report dictionaries
     """
-    today = datetime.datetime.now().strftime('%Y%m%d')
-    filename = os.path.join(FOLDERS['combined_reports'], f'ipl_venue_reports_{today}.csv')
-    
     # Create a dictionary to quickly lookup reports by city
     pitch_dict = {report["city"]: report for report in pitch_reports}
     weather_dict = {report["city"]: report for report in weather_reports}
@@ -527,37 +705,44 @@ def save_combined_reports_to_csv(venues, pitch_reports, weather_reports):
             combined_report["current_condition"] = weather_data.get("current_condition", "Not available")
             combined_report["humidity"] = weather_data.get("humidity", "Not available")
             combined_report["wind_speed"] = weather_data.get("wind_speed", "Not available")
-            
-            # Convert forecast to string
-            forecast = weather_data.get("forecast", "Not available")
-            if isinstance(forecast, list):
-                forecast_str = ""
-                for day in forecast:
-                    forecast_str += f"{day['date']}: {day['temp']}°C, {day['condition']}, {day['humidity']}% humidity\n"
-                combined_report["forecast"] = forecast_str.strip()
-            else:
-                combined_report["forecast"] = forecast
+            combined_report["forecast"] = weather_data.get("forecast", "Not available")
         
-        combined_report["last_updated"] = datetime.datetime.now().strftime('%Y-%m-%d')
+        combined_report["last_updated"] = TODAY_STR
         
         combined_reports.append(combined_report)
     
-    # Create DataFrame
-    df = pd.DataFrame(combined_reports)
+    return combined_reports
+
+
+def save_combined_reports_to_csv(venues, pitch_reports, weather_reports):
+    """
+    Save combined pitch and weather reports to a CSV file
+    
+    Args:
+        venues (list): List of venue dictionaries
+        pitch_reports (list): List of pitch report dictionaries
+        weather_reports (list): List of weather report dictionaries
+    
+    Returns:
+        str: Path to the CSV file
+    """
+    filename = os.path.join(FOLDERS['combined_reports'], f'ipl_venue_reports_{TODAY_FILE}.csv')
+    
+    combined_reports = build_combined_reports(venues, pitch_reports, weather_reports)
     
     # Save to CSV
-    df.to_csv(filename, index=False)
+    write_csv(filename, combined_reports)
     print(f"{Fore.GREEN}Combined reports saved to {filename}{Style.RESET_ALL}")
     
     # Save a more readable HTML report
-    html_file = os.path.join(FOLDERS['combined_reports'], f'ipl_venue_reports_{today}.html')
+    html_file = os.path.join(FOLDERS['combined_reports'], f'ipl_venue_reports_{TODAY_FILE}.html')
     
     # Create HTML content
-    html_content = f"""
+    html_parts = [f"""
     <!DOCTYPE html>
     <html>
     <head>
-        <title>IPL 2025 Venue Reports - {today}</title>
+        <title>IPL 2025 Venue Reports - {TODAY_FILE}</title>
         <style>
             body {{ font-family: Arial, sans-serif; margin: 20px; }}
             h1, h2, h3 {{ color: #1a5276; }}
@@ -598,11 +783,11 @@ def save_combined_reports_to_csv(venues, pitch_reports, weather_reports):
     <body>
         <h1>IPL 2025 Venue Reports</h1>
         <p>Generated on: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-    """
+    """]
     
     # Add venue cards
     for report in combined_reports:
-        html_content += f"""
+        html_parts.append(f"""
         <div class="venue-card">
             <div class="venue-name">{report['venue']} - {report['city']}, {report['state']}</div>
             
@@ -657,12 +842,13 @@ def save_combined_reports_to_csv(venues, pitch_reports, weather_reports):
                 <div class="forecast">{report.get('forecast', 'Not available')}</div>
             </div>
         </div>
-        """
+        """)
     
-    html_content += """
+    html_parts.append("""
     </body>
     </html>
-    """
+    """)
+    html_content = "".join(html_parts)
     
     with open(html_file, 'w', encoding='utf-8') as f:
         f.write(html_content)
@@ -672,64 +858,128 @@ def save_combined_reports_to_csv(venues, pitch_reports, weather_reports):
     return filename, html_file
 
 
-def scrape_pitch_reports():
+def create_http_session():
     """
-    Scrape pitch reports for all IPL venues using direct Cricbuzz URLs
+    Create the shared HTTP session used for Cricbuzz and OpenWeather requests
+    
+    Connections are kept alive and pooled per host, so every request after
+    the first to a host skips the TCP and TLS handshake.
     
     Returns:
-        list: List of pitch report dictionaries
+        aiohttp.ClientSession: Session with the common headers
     """
-    print(f"\n{Fore.CYAN}===== Scraping Pitch Reports ====={Style.RESET_ALL}")
+    connector = aiohttp.TCPConnector(limit=16, limit_per_host=8, ttl_dns_cache=300, keepalive_timeout=30)
+    return aiohttp.ClientSession(headers=HEADERS, connector=connector, timeout=HTTP_TIMEOUT)
+
+
+async def fetch_all_pitch_reports(session):
+    """
+    Fetch pitch reports for all IPL venues concurrently
     
-    pitch_reports = []
+    Args:
+        session (aiohttp.ClientSession): Shared HTTP session
     
-    for venue in IPL_VENUES:
-        # Get pitch report directly from Cricbuzz using the venue object with URLs
-        pitch_data = fetch_cricbuzz_pitch_report(venue)
-        pitch_reports.append(pitch_data)
-        
+    Returns:
+        list: List of pitch report dictionaries, in IPL_VENUES order
+    """
+    # Bounded concurrency instead of a fixed delay between requests
+    semaphore = asyncio.Semaphore(CRICBUZZ_MAX_CONCURRENCY)
+    
+    return await asyncio.gather(
+        *(fetch_cricbuzz_pitch_report(venue, session, semaphore) for venue in IPL_VENUES)
+    )
+
+
+async def save_all_reports(pitch_reports, weather_reports):
+    """
+    Write the pitch, weather and combined reports at the same time
+    
+    Each save function runs in a worker thread, so the file writes overlap.
+    
+    Args:
+        pitch_reports (list): List of pitch report dictionaries
+        weather_reports (list): List of weather report dictionaries
+    
+    Returns:
+        tuple: (pitch CSV path, weather CSV path, (combined CSV path, HTML path))
+    """
+    loop = asyncio.get_running_loop()
+    return await asyncio.gather(
+        loop.run_in_executor(None, save_pitch_reports_to_csv, pitch_reports),
+        loop.run_in_executor(None, save_weather_reports_to_csv, weather_reports),
+        loop.run_in_executor(None, save_combined_reports_to_csv, IPL_VENUES, pitch_reports, weather_reports)
+    )
+
+
+def print_pitch_report_previews(pitch_reports):
+    """
+    Print a short preview of each venue's pitch report
+    
+    Args:
+        pitch_reports (list): List of pitch report dictionaries, in IPL_VENUES order
+    """
+    print(f"\n{Fore.CYAN}===== Pitch Reports ====={Style.RESET_ALL}")
+    
+    for venue, pitch_data in zip(IPL_VENUES, pitch_reports):
         # Print a preview of the data
         print(f"\n{Fore.GREEN}Pitch Report for {venue['name']} ({venue['city']}){Style.RESET_ALL}")
         print(f"Description: {pitch_data['pitch_report'][:150]}..." if len(pitch_data['pitch_report']) > 150 else f"Description: {pitch_data['pitch_report']}")
         print(f"Average Score: {pitch_data['average_score']}")
         print(f"Highest Score: {pitch_data['highest_score']}")
         print(f"Characteristics: {pitch_data['characteristics']}")
-        
-        # Add a small delay to avoid rate limiting
-        time.sleep(2)
+
+
+async def fetch_all_weather_data(session):
+    """
+    Fetch weather data for all IPL venues concurrently
     
-    return pitch_reports
+    Args:
+        session (aiohttp.ClientSession): Shared HTTP session
+    
+    Returns:
+        list: List of weather report dictionaries, in IPL_VENUES order
+    """
+    semaphore = asyncio.Semaphore(OPENWEATHER_MAX_CONCURRENCY)
+    
+    return await asyncio.gather(
+        *(fetch_weather_data(session, semaphore, venue["city"], venue["state"]) for venue in IPL_VENUES)
+    )
 
 
-def get_weather_reports():
+async def fetch_all_venue_reports():
     """
-    Get weather reports for all IPL venues
+    Fetch pitch reports and weather data for all IPL venues at the same time
+    
+    Both sets of requests share one HTTP session, so the total time is that
+    of the slower phase rather than the sum of both.
     
     Returns:
-        list: List of weather report dictionaries
+        tuple: (pitch reports, weather reports), each in IPL_VENUES order
     """
-    print(f"\n{Fore.CYAN}===== Getting Weather Reports ====={Style.RESET_ALL}")
+    async with create_http_session() as session:
+        return await asyncio.gather(
+            fetch_all_pitch_reports(session),
+            fetch_all_weather_data(session)
+        )
+
+
+def get_venue_reports():
+    """
+    Get pitch and weather reports for all IPL venues
     
-    weather_reports = []
+    Returns:
+        tuple: (list of pitch report dictionaries, list of weather report dictionaries)
+    """
+    print(f"\n{Fore.CYAN}===== Fetching Pitch and Weather Reports ====={Style.RESET_ALL}")
     
-    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-        # Submit tasks
-        future_to_venue = {
-            executor.submit(fetch_weather_data, venue["city"], venue["state"]): venue
-            for venue in IPL_VENUES
-        }
-        
-        # Process results as they complete
-        for future in concurrent.futures.as_completed(future_to_venue):
-            venue = future_to_venue[future]
-            try:
-                weather_data = future.result()
-                weather_reports.append(weather_data)
-                print(f"{Fore.GREEN}Completed weather report for {venue['city']}{Style.RESET_ALL}")
-            except Exception as e:
-                print(f"{Fore.RED}Error processing weather for {venue['city']}: {str(e)}{Style.RESET_ALL}")
+    pitch_reports, weather_reports = asyncio.run(fetch_all_venue_reports())
+    
+    print_pitch_report_previews(pitch_reports)
     
-    return weather_reports
+    for weather_data in weather_reports:
+        print(f"{Fore.GREEN}Completed weather report for {weather_data['city']}{Style.RESET_ALL}")
+    
+    return pitch_reports, weather_reports
 
 
 def display_pitch_report_terminal(venue_name, pitch_data):
@@ -769,23 +1019,16 @@ def main():
     # Create folder structure
     create_folders()
     
-    # Scrape pitch reports
-    pitch_reports = scrape_pitch_reports()
+    # Fetch pitch and weather reports concurrently
+    pitch_reports, weather_reports = get_venue_reports()
     
     # Display detailed pitch reports in terminal
     print(f"\n{Fore.CYAN}===== Detailed Pitch Reports ====={Style.RESET_ALL}")
     for pitch_data in pitch_reports:
         display_pitch_report_terminal(pitch_data["venue"], pitch_data)
     
-    # Get weather reports
-    weather_reports = get_weather_reports()
-    
-    # Save reports to CSV
-    pitch_csv = save_pitch_reports_to_csv(pitch_reports)
-    weather_csv = save_weather_reports_to_csv(weather_reports)
-    
-    # Save combined reports
-    combined_csv, combined_html = save_combined_reports_to_csv(IPL_VENUES, pitch_reports, weather_reports)
+    # Save pitch, weather and combined reports
+    pitch_csv, weather_csv, (combined_csv, combined_html) = asyncio.run(save_all_reports(pitch_reports, weather_reports))
     
     print(f"\n{Fore.GREEN}All tasks completed.{Style.RESET_ALL}")
     print(f"{Fore.CYAN}======================================{Style.RESET_ALL}")
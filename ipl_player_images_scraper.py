@@ -1,16 +1,45 @@
-from bs4 import BeautifulSoup
-import requests
+import lxml.etree
+import lxml.html
+import aiohttp
+import asyncio
 import os
 import datetime
 from colorama import init, Fore, Style
-import time
 import urllib.parse
 import re
 import json
+import logging
+import logging.handlers
+from collections import defaultdict
 
 # Initialize colorama for colored console output
 init()
 
+class ColorFormatter(logging.Formatter):
+    """Formatter that colors each log line by its level"""
+    LEVEL_COLORS = {
+        logging.DEBUG: Fore.MAGENTA,
+        logging.INFO: Fore.CYAN,
+        logging.WARNING: Fore.YELLOW,
+        logging.ERROR: Fore.RED,
+        logging.CRITICAL: Fore.RED,
+    }
+
+    def format(self, record):
+        return f"{self.LEVEL_COLORS.get(record.levelno, '')}{super().format(record)}{Style.RESET_ALL}"
+
+# Progress messages are buffered and written in batches (at the end of each team,
+# when the buffer fills, or straight away for errors) instead of one write per line
+LOG_BUFFER_CAPACITY = 100
+LOG_STREAM_HANDLER = logging.StreamHandler()
+LOG_STREAM_HANDLER.setFormatter(ColorFormatter("%(message)s"))
+LOG_BUFFER = logging.handlers.MemoryHandler(LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=LOG_STREAM_HANDLER)
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+logger.addHandler(LOG_BUFFER)
+logger.propagate = False
+
 # Define the team URLs
 TEAM_URLS = [
     "https://www.iplt20.com/teams/chennai-super-kings",
@@ -31,266 +60,522 @@ if not os.path.exists(PLAYER_IMAGES_FOLDER):
     os.makedirs(PLAYER_IMAGES_FOLDER)
     print(f"{Fore.GREEN}Created folder: {PLAYER_IMAGES_FOLDER}{Style.RESET_ALL}")
 
+# Default headers for every request made through the shared session
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+
+# Extra headers for image requests to accept AVIF format
+IMAGE_HEADERS = {
+    "Accept": "image/avif,image/webp,image/png,image/*,*/*;q=0.8"
+}
+
+# Retry policy for rate-limited and failed requests: 0.5s, 1s, 2s, 4s, 8s
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 5
+RETRY_BACKOFF_FACTOR = 0.5
+
+# Player card XPaths, compiled once; the field XPaths are relative to a card
+PLAYER_CARD_XPATH = lxml.etree.XPath("//*[contains(concat(' ', normalize-space(@class), ' '), ' ih-pcard1 ')]")
+PLAYER_LINK_XPATH = lxml.etree.XPath("(.//a)[1]")
+PLAYER_NAME_XPATH = lxml.etree.XPath("(.//*[contains(concat(' ', normalize-space(@class), ' '), ' ih-p-cont-in ')]//h3)[1]")
+PLAYER_ROLE_XPATH = lxml.etree.XPath(
+    "(.//*[contains(concat(' ', normalize-space(@class), ' '), ' d-block ')"
+    " and contains(concat(' ', normalize-space(@class), ' '), ' w-100 ')"
+    " and contains(concat(' ', normalize-space(@class), ' '), ' text-center ')])[1]"
+)
+PLAYER_IMAGE_URL_XPATH = lxml.etree.XPath("(.//img[contains(concat(' ', normalize-space(@class), ' '), ' lazyload ')]/@data-src)[1]")
+
+# Maximum number of concurrent image downloads from any one host
+MAX_DOWNLOADS_PER_HOST = 4
+
+# Download workers per team, fed through a bounded queue while the page is walked
+DOWNLOAD_WORKERS = 8
+PLAYER_QUEUE_SIZE = 32
+
+# One semaphore per image host, created on first use inside the event loop
+HOST_SEMAPHORES = defaultdict(lambda: asyncio.Semaphore(MAX_DOWNLOADS_PER_HOST))
+
+# Images larger than this are streamed to disk in STREAM_CHUNK_SIZE chunks
+STREAM_THRESHOLD_BYTES = 1024 * 1024
+STREAM_CHUNK_SIZE = 256 * 1024
+
+# Cached team pages with their Last-Modified/ETag validators, for conditional GETs
+TEAM_PAGE_CACHE_FOLDER = os.path.join('.http_cache', 'team_pages')
+
+# Characters replaced with '_' in image filenames (everything except letters, digits, '_' and '-', so spaces too)
+UNSAFE_FILENAME_CHARS = re.compile(r'[^\w-]')
+
+# Per-team-folder index of image ID -> ETag/Last-Modified, for conditional GETs on re-runs
+IMAGE_VALIDATORS_FILE = 'image_validators.json'
+
+# Image files end in _<image ID>.<ext>, e.g. MS_Dhoni_WK-Batter_57.png
+IMAGE_ID_PATTERN = re.compile(r'_(\d+)\.(?:avif|webp|png|jpg)$')
+
+# Set IPL_DEBUG=1 to save the fetched team pages to debug_files
+DEBUG = os.environ.get("IPL_DEBUG", "0") == "1"
+
 # Debug files folder
 DEBUG_FILES_FOLDER = 'debug_files'
-if not os.path.exists(DEBUG_FILES_FOLDER):
+if DEBUG and not os.path.exists(DEBUG_FILES_FOLDER):
     os.makedirs(DEBUG_FILES_FOLDER)
     print(f"{Fore.GREEN}Created folder: {DEBUG_FILES_FOLDER}{Style.RESET_ALL}")
 
-def fetch_team_page(team_url):
+async def get_with_backoff(session, url, headers=None):
+    """
+    GET a URL, retrying rate-limited (429), 5xx and connection failures with exponential backoff
+    
+    A Retry-After header given in seconds is honoured instead of the computed delay.
+    
+    Args:
+        session (aiohttp.ClientSession): Shared HTTP session
+        url (str): URL to fetch
+        headers (dict, optional): Extra request headers
+    
+    Returns:
+        aiohttp.ClientResponse: The final response; use it with "async with" to release it
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        delay = RETRY_BACKOFF_FACTOR * (2 ** attempt)
+        try:
+            response = await session.get(url, headers=headers)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if attempt == MAX_RETRIES:
+                raise
+        else:
+            if response.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                return response
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                delay = int(retry_after)
+            response.release()
+        
+        logger.warning(f"Retrying {url} in {delay:.1f}s (attempt {attempt + 2}/{MAX_RETRIES + 1})")
+        await asyncio.sleep(delay)
+
+def load_cached_team_page(team_name):
+    """
+    Load a previously fetched team page and its validators
+    
+    Returns:
+        tuple: (HTML bytes, dict with last_modified/etag) or (None, {}) if not cached
+    """
+    html_path = os.path.join(TEAM_PAGE_CACHE_FOLDER, f"{team_name}.html")
+    meta_path = os.path.join(TEAM_PAGE_CACHE_FOLDER, f"{team_name}.json")
+    if not (os.path.exists(html_path) and os.path.exists(meta_path)):
+        return None, {}
+    
+    with open(html_path, 'rb') as f:
+        content = f.read()
+    with open(meta_path, 'r', encoding='utf-8') as f:
+        validators = json.load(f)
+    return content, validators
+
+def save_cached_team_page(team_name, content, validators):
+    """
+    Save a team page with the Last-Modified/ETag headers it was served with
+    """
+    if not os.path.exists(TEAM_PAGE_CACHE_FOLDER):
+        os.makedirs(TEAM_PAGE_CACHE_FOLDER)
+    
+    with open(os.path.join(TEAM_PAGE_CACHE_FOLDER, f"{team_name}.html"), 'wb') as f:
+        f.write(content)
+    with open(os.path.join(TEAM_PAGE_CACHE_FOLDER, f"{team_name}.json"), 'w', encoding='utf-8') as f:
+        json.dump(validators, f)
+
+def find_existing_images(team_folder):
+    """
+    Index the images already downloaded to a team folder by image ID
+    
+    Args:
+        team_folder (str): Team image folder
+    
+    Returns:
+        dict: Image ID -> file path
+    """
+    existing = {}
+    for filename in os.listdir(team_folder):
+        match = IMAGE_ID_PATTERN.search(filename)
+        if match:
+            existing[match.group(1)] = os.path.join(team_folder, filename)
+    return existing
+
+async def fetch_team_page(session, team_url):
     """
     Fetch a team page from IPL website
     
     Args:
+        session (aiohttp.ClientSession): Shared HTTP session
         team_url (str): URL of the team page
     
     Returns:
-        BeautifulSoup object or None if request failed
+        lxml.html.HtmlElement: Parsed page, or None if request failed
     """
     team_name = team_url.split('/')[-1]
-    print(f"{Fore.CYAN}Fetching {team_name} page from {team_url}...{Style.RESET_ALL}")
-    
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-    }
+    logger.info(f"Fetching {team_name} page from {team_url}...")
     
     try:
-        response = requests.get(team_url, headers=headers)
-        response.raise_for_status()
+        # Conditional GET: an unchanged page comes back as an empty 304
+        cached_content, validators = load_cached_team_page(team_name)
+        request_headers = {}
+        if cached_content is not None:
+            if validators.get("last_modified"):
+                request_headers["If-Modified-Since"] = validators["last_modified"]
+            if validators.get("etag"):
+                request_headers["If-None-Match"] = validators["etag"]
+        
+        async with await get_with_backoff(session, team_url, request_headers) as response:
+            if response.status == 304:
+                logger.info(f"{team_name} page not modified - using cached copy")
+                content = cached_content
+            else:
+                response.raise_for_status()
+                content = await response.read()
+                
+                validators = {
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "etag": response.headers.get("ETag")
+                }
+                if validators["last_modified"] or validators["etag"]:
+                    save_cached_team_page(team_name, content, validators)
         
-        # Save HTML for debugging
-        debug_filename = os.path.join(DEBUG_FILES_FOLDER, f"{team_name}_player_images_page_{datetime.datetime.now().strftime('%Y%m%d')}.html")
-        with open(debug_filename, "w", encoding="utf-8") as f:
-            f.write(response.text)
-        print(f"{Fore.GREEN}Saved HTML to {debug_filename}{Style.RESET_ALL}")
+        # Save HTML for debugging, as the raw bytes that were served
+        if DEBUG:
+            debug_filename = os.path.join(DEBUG_FILES_FOLDER, f"{team_name}_player_images_page_{datetime.datetime.now().strftime('%Y%m%d')}.html")
+            with open(debug_filename, "wb") as f:
+                f.write(content)
+            logger.info(f"Saved HTML to {debug_filename}")
         
         # Parse HTML
-        soup = BeautifulSoup(response.content, 'html.parser')
-        return soup
+        return lxml.html.fromstring(content)
     
-    except requests.exceptions.RequestException as e:
-        print(f"{Fore.RED}Network error fetching {team_name} page: {e}{Style.RESET_ALL}")
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.error(f"Network error fetching {team_name} page: {e}")
         return None
     except Exception as e:
-        print(f"{Fore.RED}Unexpected error fetching {team_name} page: {e}{Style.RESET_ALL}")
+        logger.error(f"Unexpected error fetching {team_name} page: {e}")
         return None
 
-def extract_player_image_urls(soup):
+def extract_player_image_urls(tree):
     """
     Extract player image URLs directly from the HTML
     
     Args:
-        soup: BeautifulSoup object
+        tree (lxml.html.HtmlElement): Parsed team page
     
-    Returns:
-        list: List of dictionaries with player info and image URLs
+    Yields:
+        tuple: (name, role, url_id, image_id, image_url) for each player card with an image
     """
-    players = []
-    
     # Find all player card elements
-    player_cards = soup.select('.ih-pcard1')
-    
-    print(f"{Fore.YELLOW}Found {len(player_cards)} potential player cards on the page.{Style.RESET_ALL}")
+    player_cards = PLAYER_CARD_XPATH(tree)
     
-    # Find all lazyload images with data-src
-    images_with_data_src = soup.select('img.lazyload[data-src]')
-    print(f"{Fore.YELLOW}Found {len(images_with_data_src)} images with data-src attributes.{Style.RESET_ALL}")
+    logger.info(f"Found {len(player_cards)} potential player cards on the page.")
     
     for card in player_cards:
         # Get player link
-        player_link = card.find('a')
+        player_link = PLAYER_LINK_XPATH(card)
         if not player_link:
             continue
+        player_link = player_link[0]
+        
+        # Find the image in this card; cards without one are skipped
+        img_url = PLAYER_IMAGE_URL_XPATH(card)
+        if not img_url or not img_url[0]:
+            continue
+        img_url = str(img_url[0])
             
         # Get player name from data-player_name attribute or text content
         player_name = player_link.get('data-player_name', '')
         if not player_name:
-            name_elem = card.select_one('.ih-p-cont-in h3')
+            name_elem = PLAYER_NAME_XPATH(card)
             if name_elem:
-                player_name = name_elem.text.strip()
+                player_name = name_elem[0].text_content().strip()
         
         # Get player ID from href attribute
         href = player_link.get('href', '')
         player_id = href.split('/')[-1].strip() if href else ''
         
         # Get player role
-        role_elem = card.select_one('.d-block.w-100.text-center')
-        role = role_elem.text.strip() if role_elem else ""
+        role_elem = PLAYER_ROLE_XPATH(card)
+        role = role_elem[0].text_content().strip() if role_elem else ""
         
-        # Find the image in this card
-        img_elem = card.select_one('img.lazyload[data-src]')
-        if img_elem and img_elem.get('data-src'):
-            img_url = img_elem['data-src']
+        # Extract the image ID from URL (e.g., 102.png from https://documents.iplt20.com/ipl/IPLHeadshot2025/102.png)
+        img_id = img_url.split('/')[-1].split('.')[0]
+        
+        logger.info(f"Found player: {player_name} (Image ID: {img_id})")
+        # url_id is the ID from the player URL, image_id the one from the image URL
+        yield player_name, role, player_id, img_id, img_url
+
+def write_file(filepath, content):
+    """
+    Write bytes to a file; used from worker threads
+    """
+    with open(filepath, 'wb') as f:
+        f.write(content)
+
+async def download_player_image(session, name, role, image_id, img_url, team_folder, existing_images, image_validators, index):
+    """
+    Download a single player's image
+    
+    Args:
+        session (aiohttp.ClientSession): Shared HTTP session
+        name (str): Player name
+        role (str): Player role
+        image_id (str): Image ID from the image URL
+        img_url (str): Image URL
+        team_folder (str): Folder to save the image in
+        existing_images (dict): Image ID -> path of images already in team_folder
+        image_validators (dict): Image ID -> ETag/Last-Modified of the saved image; updated in place
+        index (int): Position of the player in the team list, for progress output
+    
+    Returns:
+        tuple: (download status, local path, ETag, Last-Modified)
+    """
+    try:
+        if not img_url:
+            logger.warning(f"No image URL for {name} - skipping")
+            return "No image URL", "", None, None
+        
+        # Images downloaded on an earlier run are revalidated with a conditional GET
+        # when their ETag/Last-Modified is known, and skipped without a request otherwise
+        validators = image_validators.get(image_id) if image_id in existing_images else None
+        if image_id in existing_images and not validators:
+            logger.info(f"Image for {name} already exists - skipping")
+            return "Already exists", existing_images[image_id], None, None
             
-            # Extract the image ID from URL (e.g., 102.png from https://documents.iplt20.com/ipl/IPLHeadshot2025/102.png)
-            img_id = img_url.split('/')[-1].split('.')[0] if img_url else ''
+        # Create a valid filename from player name
+        valid_filename = UNSAFE_FILENAME_CHARS.sub('_', name)
+        
+        # Add role to filename if available
+        if role:
+            valid_filename = f"{valid_filename}_{UNSAFE_FILENAME_CHARS.sub('_', role)}"
+        
+        # Add image ID to ensure uniqueness
+        if image_id:
+            valid_filename = f"{valid_filename}_{image_id}"
+        
+        # Determine file extension from URL
+        if ".avif" in img_url.lower():
+            file_extension = ".avif"
+        elif ".webp" in img_url.lower():
+            file_extension = ".webp"  
+        elif ".png" in img_url.lower():
+            file_extension = ".png"
+        else:
+            file_extension = ".jpg"  # Default
+        
+        # Create complete filename
+        filename = f"{valid_filename}{file_extension}"
+        filepath = existing_images[image_id] if validators else os.path.join(team_folder, filename)
+        
+        request_headers = dict(IMAGE_HEADERS)
+        if validators:
+            if validators.get("etag"):
+                request_headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                request_headers["If-Modified-Since"] = validators["last_modified"]
+        elif os.path.exists(filepath):
+            # File exists but isn't indexed by image ID (e.g. no image ID in the URL)
+            logger.info(f"Image for {name} already exists - skipping")
+            return "Already exists", filepath, None, None
             
-            players.append({
-                "name": player_name,
-                "role": role,
-                "url_id": player_id,  # ID from URL
-                "image_id": img_id,   # ID from image URL
-                "image_url": img_url
-            })
-            print(f"{Fore.MAGENTA}Found player: {player_name} (Image ID: {img_id}){Style.RESET_ALL}")
-    
-    return players
+        # Download the image
+        logger.info(f"[{index+1}] Downloading image for {name}...")
+        # Disk writes run in worker threads so they overlap with other downloads
+        loop = asyncio.get_running_loop()
+        async with HOST_SEMAPHORES[urllib.parse.urlparse(img_url).netloc]:
+            async with await get_with_backoff(session, img_url, request_headers) as response:
+                if response.status == 304:
+                    logger.info(f"Image for {name} not modified - skipping")
+                    return "Not modified", filepath, validators.get("etag"), validators.get("last_modified")
+                
+                response.raise_for_status()
+                new_validators = {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified")
+                }
+                
+                if response.content_length is not None and response.content_length > STREAM_THRESHOLD_BYTES:
+                    # Stream unusually large files instead of holding them in memory
+                    try:
+                        with open(filepath, 'wb') as f:
+                            async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                                await loop.run_in_executor(None, f.write, chunk)
+                    except Exception:
+                        # Don't leave a partial file that later runs would treat as downloaded
+                        if os.path.exists(filepath):
+                            os.remove(filepath)
+                        raise
+                else:
+                    # Headshots are small, so write them in one go
+                    content = await response.read()
+                    await loop.run_in_executor(None, write_file, filepath, content)
+        
+        logger.info(f"Downloaded image for {name} to {filepath}")
+        
+        # Remember the validators for the next run
+        if image_id and (new_validators["etag"] or new_validators["last_modified"]):
+            image_validators[image_id] = new_validators
+        
+        return "Updated" if validators else "Success", filepath, new_validators["etag"], new_validators["last_modified"]
+        
+    except Exception as e:
+        logger.error(f"Error downloading image for {name}: {e}")
+        return f"Error: {str(e)}", "", None, None
 
-def download_player_images(players, team_name):
+async def download_player_images(session, tree, team_name):
     """
-    Download player images to local folder
+    Download player images to local folder as they are extracted from the team page
+    
+    A producer walks the player cards and queues each player while
+    DOWNLOAD_WORKERS consumers download from the queue, so the first image
+    requests go out before the whole page has been walked.
     
     Args:
-        players: List of dictionaries containing player info and image URLs
+        session (aiohttp.ClientSession): Shared HTTP session
+        tree (lxml.html.HtmlElement): Parsed team page
         team_name: Name of the team
     
     Returns:
-        list: List of dictionaries with updated download status
+        dict: Player info and download results as parallel lists (names, roles,
+        url_ids, image_ids, image_urls, download_statuses, local_paths, etags,
+        last_modified); index i of each list is one player
     """
-    print(f"{Fore.CYAN}Downloading {len(players)} player images for {team_name}...{Style.RESET_ALL}")
+    logger.info(f"Downloading player images for {team_name}...")
     
     team_folder = os.path.join(PLAYER_IMAGES_FOLDER, team_name)
     if not os.path.exists(team_folder):
         os.makedirs(team_folder)
     
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-        # Add headers to accept AVIF format
-        "Accept": "image/avif,image/webp,image/png,image/*,*/*;q=0.8"
-    }
+    existing_images = find_existing_images(team_folder)
+    
+    validators_file = os.path.join(team_folder, IMAGE_VALIDATORS_FILE)
+    try:
+        with open(validators_file, 'r', encoding='utf-8') as f:
+            image_validators = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        # Missing, or truncated by an interrupted run; the images are simply fetched again
+        image_validators = {}
     
-    for i, player in enumerate(players):
+    players = {"names": [], "roles": [], "url_ids": [], "image_ids": [], "image_urls": []}
+    results = {}
+    queue = asyncio.Queue(maxsize=PLAYER_QUEUE_SIZE)
+    
+    async def produce():
         try:
-            if not player.get("image_url"):
-                print(f"{Fore.YELLOW}No image URL for {player['name']} - skipping{Style.RESET_ALL}")
-                player["download_status"] = "No image URL"
-                continue
-                
-            # Create a valid filename from player name
-            valid_filename = "".join(c if c.isalnum() or c in [' ', '_', '-'] else '_' for c in player["name"])
-            valid_filename = valid_filename.replace(' ', '_')
-            
-            # Add role to filename if available
-            if player.get("role"):
-                role_text = "".join(c if c.isalnum() or c in [' ', '_', '-'] else '_' for c in player["role"])
-                valid_filename = f"{valid_filename}_{role_text.replace(' ', '_')}"
-            
-            # Add image ID to ensure uniqueness
-            if player.get("image_id"):
-                valid_filename = f"{valid_filename}_{player['image_id']}"
-            
-            # Determine file extension from URL
-            img_url = player["image_url"]
-            if ".avif" in img_url.lower():
-                file_extension = ".avif"
-            elif ".webp" in img_url.lower():
-                file_extension = ".webp"  
-            elif ".png" in img_url.lower():
-                file_extension = ".png"
-            else:
-                file_extension = ".jpg"  # Default
-            
-            # Create complete filename
-            filename = f"{valid_filename}{file_extension}"
-            filepath = os.path.join(team_folder, filename)
-            
-            # Check if file already exists
-            if os.path.exists(filepath):
-                print(f"{Fore.YELLOW}Image for {player['name']} already exists - skipping{Style.RESET_ALL}")
-                player["download_status"] = "Already exists"
-                player["local_path"] = filepath
-                continue
-                
-            # Download the image
-            print(f"{Fore.CYAN}[{i+1}/{len(players)}] Downloading image for {player['name']}...{Style.RESET_ALL}")
-            response = requests.get(player["image_url"], headers=headers, stream=True)
-            response.raise_for_status()
-            
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-            
-            print(f"{Fore.GREEN}Downloaded image for {player['name']} to {filepath}{Style.RESET_ALL}")
-            
-            # Update player info with download status and local path
-            player["download_status"] = "Success"
-            player["local_path"] = filepath
-            
-            # Sleep for a short time to avoid hammering the server
-            time.sleep(0.5)
-            
-        except Exception as e:
-            print(f"{Fore.RED}Error downloading image for {player['name']}: {e}{Style.RESET_ALL}")
-            player["download_status"] = f"Error: {str(e)}"
-            player["local_path"] = ""
+            for index, (name, role, url_id, image_id, img_url) in enumerate(extract_player_image_urls(tree)):
+                players["names"].append(name)
+                players["roles"].append(role)
+                players["url_ids"].append(url_id)
+                players["image_ids"].append(image_id)
+                players["image_urls"].append(img_url)
+                await queue.put((index, name, role, image_id, img_url))
+                # Let the consumers send this request before walking the next card
+                await asyncio.sleep(0)
+        finally:
+            for _ in range(DOWNLOAD_WORKERS):
+                await queue.put(None)
+    
+    async def consume():
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            index, name, role, image_id, img_url = item
+            results[index] = await download_player_image(session, name, role, image_id, img_url, team_folder, existing_images, image_validators, index)
+    
+    await asyncio.gather(produce(), *(consume() for _ in range(DOWNLOAD_WORKERS)))
+    
+    ordered = [results[index] for index in range(len(players["names"]))]
+    players["download_statuses"] = [result[0] for result in ordered]
+    players["local_paths"] = [result[1] for result in ordered]
+    players["etags"] = [result[2] for result in ordered]
+    players["last_modified"] = [result[3] for result in ordered]
+    
+    # Write to a temporary file first so an interrupted run never leaves a truncated file
+    temp_file = validators_file + '.tmp'
+    with open(temp_file, 'w', encoding='utf-8') as f:
+        json.dump(image_validators, f)
+    os.replace(temp_file, validators_file)
     
     return players
 
-def process_team(team_url):
+async def process_team(session, team_url):
     """
     Process a single team: fetch page, extract players, download images
     
     Args:
+        session (aiohttp.ClientSession): Shared HTTP session
         team_url: URL of the team page
     
     Returns:
         dict: Summary of the download results
     """
-    team_name = team_url.split('/')[-1]
-    print(f"{Fore.CYAN}Processing team: {team_name}{Style.RESET_ALL}")
-    
-    # Fetch team page
-    soup = fetch_team_page(team_url)
-    
-    if not soup:
-        print(f"{Fore.RED}Failed to fetch page for {team_name}. Skipping.{Style.RESET_ALL}")
-        return {
-            "team_name": team_name,
-            "team_url": team_url,
-            "scraping_timestamp": datetime.datetime.now().isoformat(),
-            "total_players": 0,
-            "successful_downloads": 0,
-            "error": "Failed to fetch page"
-        }
-    
-    # Extract player images
-    players = extract_player_image_urls(soup)
-    
-    if not players:
-        print(f"{Fore.RED}No player images found for {team_name}.{Style.RESET_ALL}")
-        return {
+    try:
+        team_name = team_url.split('/')[-1]
+        logger.info(f"Processing team: {team_name}")
+    
+        # Fetch team page
+        tree = await fetch_team_page(session, team_url)
+    
+        if tree is None:
+            logger.error(f"Failed to fetch page for {team_name}. Skipping.")
+            return {
+                "team_name": team_name,
+                "team_url": team_url,
+                "scraping_timestamp": datetime.datetime.now().isoformat(),
+                "total_players": 0,
+                "successful_downloads": 0,
+                "error": "Failed to fetch page"
+            }
+    
+        # Extract players and download their images
+        players = await download_player_images(session, tree, team_name)
+    
+        if not players["names"]:
+            logger.error(f"No player images found for {team_name}.")
+            return {
+                "team_name": team_name,
+                "team_url": team_url,
+                "scraping_timestamp": datetime.datetime.now().isoformat(),
+                "total_players": 0,
+                "successful_downloads": 0,
+                "error": "No player images found"
+            }
+    
+        # Count successful downloads
+        success_count = sum(1 for status in players["download_statuses"] if status in ["Success", "Updated", "Already exists", "Not modified"])
+        logger.info(f"Successfully downloaded/found {success_count} out of {len(players['names'])} player images for {team_name}.")
+    
+        # Create summary
+        summary = {
             "team_name": team_name,
             "team_url": team_url,
             "scraping_timestamp": datetime.datetime.now().isoformat(),
-            "total_players": 0,
-            "successful_downloads": 0,
-            "error": "No player images found"
+            "total_players": len(players["names"]),
+            "successful_downloads": success_count,
+            "players": players
         }
     
-    # Download player images
-    players = download_player_images(players, team_name)
-    
-    # Count successful downloads
-    success_count = sum(1 for player in players if player.get("download_status") in ["Success", "Already exists"])
-    print(f"\n{Fore.GREEN}Successfully downloaded/found {success_count} out of {len(players)} player images for {team_name}.{Style.RESET_ALL}")
-    
-    # Create summary
-    summary = {
-        "team_name": team_name,
-        "team_url": team_url,
-        "scraping_timestamp": datetime.datetime.now().isoformat(),
-        "total_players": len(players),
-        "successful_downloads": success_count,
-        "players": players
-    }
+        # The summary is saved as part of the overall summary in main()
+        return summary
+    finally:
+        LOG_BUFFER.flush()
+
+async def process_all_teams():
+    """
+    Process all teams concurrently over one shared HTTP session
     
-    # Save summary to file
-    summary_file = os.path.join(PLAYER_IMAGES_FOLDER, team_name, f'download_summary_{datetime.datetime.now().strftime("%Y%m%d")}.json')
-    with open(summary_file, 'w', encoding='utf-8') as f:
-        json.dump(summary, f, indent=4)
+    The session keeps connections alive, so the team pages and the images
+    reuse a pooled connection per host instead of a new TCP+TLS handshake
+    for every request.
     
-    print(f"{Fore.GREEN}Summary saved to {summary_file}{Style.RESET_ALL}")
-    return summary
+    Returns:
+        list: Team summaries, in TEAM_URLS order
+    """
+    connector = aiohttp.TCPConnector(limit=32, limit_per_host=MAX_DOWNLOADS_PER_HOST, ttl_dns_cache=300, keepalive_timeout=30)
+    async with aiohttp.ClientSession(headers=HEADERS, connector=connector) as session:
+        return await asyncio.gather(*(process_team(session, team_url) for team_url in TEAM_URLS))
 
 def main():
     """Main function to run the IPL player images scraper"""
@@ -301,12 +586,9 @@ def main():
     start_time = datetime.datetime.now()
     print(f"Scraping started at: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
     
-    # Process each team and collect summaries
-    all_summaries = []
-    for team_url in TEAM_URLS:
-        team_summary = process_team(team_url)
-        all_summaries.append(team_summary)
-        print(f"{Fore.CYAN}--------------------------------------{Style.RESET_ALL}")
+    # Process all teams and collect summaries
+    all_summaries = asyncio.run(process_all_teams())
+    print(f"{Fore.CYAN}--------------------------------------{Style.RESET_ALL}")
     
     # Calculate overall statistics
     total_players = sum(summary["total_players"] for summary in all_summaries)
@@ -328,7 +610,7 @@ def main():
     
     overall_summary_file = os.path.join(PLAYER_IMAGES_FOLDER, f'overall_summary_{datetime.datetime.now().strftime("%Y%m%d")}.json')
     with open(overall_summary_file, 'w', encoding='utf-8') as f:
-        json.dump(overall_summary, f, indent=4)
+        json.dump(overall_summary, f, ensure_ascii=False, indent=2)
     
     print(f"{Fore.GREEN}Overall summary saved to {overall_summary_file}{Style.RESET_ALL}")
     
@@ -1,5 +1,5 @@
 import requests
-from bs4 import BeautifulSoup
+import lxml.html
 import pandas as pd
 import os
 import datetime
@@ -13,18 +13,81 @@ from selenium.common.exceptions import TimeoutException
 # URL for the IPL points table
 POINTS_TABLE_URL = "https://www.iplt20.com/points-table/men"
 
+# The standings table; matched as one class among several
+POINTS_TABLE_XPATH = "//table[contains(concat(' ', normalize-space(@class), ' '), ' ih-td-tab ')]"
+
+# Headers for the plain HTTP request
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+
 # Directory to save the points table
 OUTPUT_DIR = "points_table"
 if not os.path.exists(OUTPUT_DIR):
     os.makedirs(OUTPUT_DIR)
 
-def scrape_points_table():
-    """Scrapes the IPL points table from the official website"""
+def extract_points_table(html):
+    """
+    Extracts the points table from the page HTML
+    
+    Returns:
+        DataFrame: The points table (empty if it has no rows), or None if the
+        table is not on the page
+    """
+    tables = lxml.html.fromstring(html).xpath(POINTS_TABLE_XPATH)
+    if not tables:
+        return None
+    table = tables[0]
+    
+    # Header row from thead, or the first row if there is no thead
+    header_cells = table.xpath("(./thead/tr | .//tr)[1]/*[self::th or self::td]")
+    headers = [cell.text_content().strip() for cell in header_cells]
+    
+    # Cells are kept as text so values like "+0.571" keep their formatting
+    rows = [
+        [td.text_content().strip() for td in cells[:len(headers)]]
+        for cells in (tr.xpath('./td') for tr in table.xpath('.//tbody/tr'))
+        if len(cells) >= len(headers)
+    ]
+    
+    return pd.DataFrame(rows, columns=headers)
+
+def fetch_points_table_html():
+    """
+    Fetches the points table page over plain HTTP, without a browser
+    
+    Returns:
+        DataFrame if the page is served with the table already filled in,
+        otherwise None
+    """
+    try:
+        response = requests.get(POINTS_TABLE_URL, headers=HEADERS, timeout=15)
+        response.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        print(f"Error fetching points table page: {e}")
+        return None
+    
+    df = extract_points_table(response.text)
+    if df is None or df.empty:
+        # Table is rendered by JavaScript
+        return None
+    return df
+
+def scrape_points_table_with_browser():
+    """Loads the points table page in Chrome and extracts the rendered table"""
     print("Initializing Chrome and loading page...")
     
-    # Setup Chrome driver
+    # Setup Chrome driver: headless, no images, and return once the DOM is ready
+    # (JavaScript stays on because it renders the table)
     chrome_options = Options()
-    # chrome_options.add_argument("--headless")  # Uncomment to run in headless mode
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_argument("--log-level=3")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-logging"])
+    chrome_options.page_load_strategy = 'eager'
     driver = webdriver.Chrome(options=chrome_options)
     
     try:
@@ -36,45 +99,37 @@ def scrape_points_table():
             EC.presence_of_element_located((By.CSS_SELECTOR, "table.ih-td-tab tbody tr"))
         )
         
-        # Parse the page with BeautifulSoup
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-        
-        # Find the table
-        table = soup.select_one("table.ih-td-tab")
-        if not table:
+        df = extract_points_table(driver.page_source)
+        if df is None:
             print("Table not found on the page")
-            return None
-            
-        # Extract headers
-        header_row = table.select_one("thead tr")
-        if not header_row:
-            header_row = table.select_one("tr")  # Fallback if no thead
-            
-        headers = [header.text.strip() for header in header_row.find_all(["th", "td"])]
-        
-        # Extract rows
-        rows = []
-        for row in table.select("tbody tr"):
-            cols = row.find_all("td")
-            if len(cols) >= len(headers):
-                row_data = [col.text.strip() for col in cols[:len(headers)]]
-                rows.append(row_data)
+        return df
+    finally:
+        driver.quit()
+
+def scrape_points_table():
+    """Scrapes the IPL points table from the official website"""
+    print("Fetching points table page...")
+    
+    try:
+        # Only start a browser when the table isn't in the served HTML
+        df = fetch_points_table_html()
+        if df is None:
+            print("Points table not found in page HTML, falling back to browser")
+            df = scrape_points_table_with_browser()
+            if df is None:
+                return None
         
         # If no rows found but table structure exists, this might be pre-season
-        if not rows and table:
+        if df.empty:
             print("No data rows found - IPL season might not have started yet")
             return None
             
-        # Create dataframe
-        df = pd.DataFrame(rows, columns=headers)
-        print(f"Successfully scraped IPL points table with {len(rows)} team entries")
+        print(f"Successfully scraped IPL points table with {len(df)} team entries")
         return df
         
     except Exception as e:
         print(f"Error scraping points table: {e}")
         return None
-    finally:
-        driver.quit()
 
 def save_points_table(df):
     """Saves the points table to a CSV file"""
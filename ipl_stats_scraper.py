@@ -1,30 +1,263 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+import lxml.html
 import pandas as pd
+import numpy as np
 import datetime
 import re
-import csv
 import os
+import time
 import json
+import concurrent.futures
+import functools
+import argparse
 from colorama import init, Fore, Style
 
 # Initialize colorama for colored console output
 init()
 
+# Colored status words and banner line for console output
+SUCCESS_STATUS = f"{Fore.GREEN}Success{Style.RESET_ALL}"
+FAILED_STATUS = f"{Fore.RED}Failed{Style.RESET_ALL}"
+BANNER_LINE = f"{Fore.CYAN}======================================{Style.RESET_ALL}"
+
 # Define folder structure
 FOLDERS = {
     'batting_stats': 'batting_stats',
     'bowling_stats': 'bowling_stats',
     'debug_files': 'debug_files',
-    'reports': 'reports'
+    'reports': 'reports',
+    'http_cache': '.http_cache'
+}
+
+# Set IPL_DEBUG=1 to save the extracted page text to debug_files
+DEBUG = os.environ.get("IPL_DEBUG", "0") == "1"
+
+# Shared HTTP session so the stats pages reuse pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.headers.update({
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+})
+SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=10))
+
+# Stats pages cached in .http_cache younger than this are reused instead of fetched again
+STATS_PAGE_CACHE_TTL = 6 * 60 * 60
+
+# Pages are parsed in chunks of this size as they are downloaded or read back
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Maximum number of stats pages fetched at once
+MAX_WORKERS = 8
+
+# Stat table rows in the page text: rank, player, team, then the numeric columns
+MOST_RUNS_PATTERN = re.compile(r'(\d+)\s+([A-Za-z\s]+)\s+([A-Za-z\s]+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+\*?)\s+([\d\.]+)\s+([\d\.]+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)')
+COUNT_STAT_PATTERN = re.compile(r'(\d+)\s+([A-Za-z\s]+)\s+([A-Za-z\s]+)\s+(\d+)\s+(\d+)\s+(\d+)')
+RATE_STAT_PATTERN = re.compile(r'(\d+)\s+([A-Za-z\s]+)\s+([A-Za-z\s]+)\s+(\d+)\s+(\d+)\s+(\d+)\s+([\d\.]+)')
+
+# Player names containing these words are page headings or menu items, not players
+NON_PLAYER_PATTERN = re.compile(r'most|batting|bowling|runs|hundreds|fifties|sixes|fours|skip|menu|search', re.IGNORECASE)
+
+# Lines containing these words are headings, not player or team names
+BATTING_HEADING_PATTERN = re.compile(r'batting|bowling|runs|most|hundreds|fifties|sixes', re.IGNORECASE)
+BOWLING_HEADING_PATTERN = re.compile(r'batting|bowling|most|wickets|maidens|economy|average|strike', re.IGNORECASE)
+
+# How each stat type is extracted and saved:
+#   category: 'batting' or 'bowling', which also picks the output folder
+#   pattern: regex for stat rows in the whitespace-collapsed page text
+#   columns: output columns; the ones after 'Inns' are the stat values
+#   value_column: main stat that manual_cleanup drops zero/low rows on, if any
+#   heading_pattern: for the line-by-line fallback, or None to skip it
+#   from_batting_backup: fall back to the saved batting stats file
+STAT_SPECS = {
+    'most-runs': {
+        'category': 'batting',
+        'pattern': MOST_RUNS_PATTERN,
+        'columns': ['Rank', 'Player', 'Team', 'Mat', 'Inns', 'Runs', 'HS', 'Avg', 'SR', '100s', '50s', '4s', '6s'],
+        'value_column': 'Runs',
+        'heading_pattern': None,
+        'from_batting_backup': False
+    },
+    'most-hundreds': {
+        'category': 'batting',
+        'pattern': COUNT_STAT_PATTERN,
+        'columns': ['Rank', 'Player', 'Team', 'Mat', 'Inns', '100s'],
+        'value_column': '100s',
+        'heading_pattern': BATTING_HEADING_PATTERN,
+        'from_batting_backup': True
+    },
+    'most-fifties': {
+        'category': 'batting',
+        'pattern': COUNT_STAT_PATTERN,
+        'columns': ['Rank', 'Player', 'Team', 'Mat', 'Inns', '50s'],
+        'value_column': '50s',
+        'heading_pattern': BATTING_HEADING_PATTERN,
+        'from_batting_backup': True
+    },
+    'most-6s': {
+        'category': 'batting',
+        'pattern': COUNT_STAT_PATTERN,
+        'columns': ['Rank', 'Player', 'Team', 'Mat', 'Inns', '6s'],
+        'value_column': '6s',
+        'heading_pattern': BATTING_HEADING_PATTERN,
+        'from_batting_backup': True
+    },
+    'most-4s': {
+        'category': 'batting',
+        'pattern': COUNT_STAT_PATTERN,
+        'columns': ['Rank', 'Player', 'Team', 'Mat', 'Inns', '4s'],
+        'value_column': '4s',
+        'heading_pattern': BATTING_HEADING_PATTERN,
+        'from_batting_backup': True
+    },
+    'most-wickets': {
+        'category': 'bowling',
+        'pattern': COUNT_STAT_PATTERN,
+        'columns': ['Rank', 'Player', 'Team', 'Mat', 'Inns', 'Wkts'],
+        'value_column': 'Wkts',
+        'heading_pattern': BOWLING_HEADING_PATTERN,
+        'from_batting_backup': False
+    },
+    'most-maidens': {
+        'category': 'bowling',
+        'pattern': COUNT_STAT_PATTERN,
+        'columns': ['Rank', 'Player', 'Team', 'Mat', 'Inns', 'Maidens'],
+        'value_column': 'Maidens',
+        'heading_pattern': BOWLING_HEADING_PATTERN,
+        'from_batting_backup': False
+    },
+    'best-bowling-average': {
+        'category': 'bowling',
+        'pattern': RATE_STAT_PATTERN,
+        'columns': ['Rank', 'Player', 'Team', 'Mat', 'Inns', 'Wkts', 'Avg'],
+        'value_column': None,
+        'heading_pattern': BOWLING_HEADING_PATTERN,
+        'from_batting_backup': False
+    },
+    'best-bowling-strike-rate': {
+        'category': 'bowling',
+        'pattern': RATE_STAT_PATTERN,
+        'columns': ['Rank', 'Player', 'Team', 'Mat', 'Inns', 'Wkts', 'SR'],
+        'value_column': None,
+        'heading_pattern': BOWLING_HEADING_PATTERN,
+        'from_batting_backup': False
+    },
+    'best-economy-rates': {
+        'category': 'bowling',
+        'pattern': RATE_STAT_PATTERN,
+        'columns': ['Rank', 'Player', 'Team', 'Mat', 'Inns', 'Overs', 'Econ'],
+        'value_column': None,
+        'heading_pattern': BOWLING_HEADING_PATTERN,
+        'from_batting_backup': False
+    }
 }
 
+# Rows matched in the page text whose player or team contains these words are headings
+STAT_ROW_PLAYER_HEADING_PATTERN = re.compile(r'batting|bowling|most|runs|hundreds|fifties|sixes|fours', re.IGNORECASE)
+STAT_ROW_TEAM_HEADING_PATTERN = re.compile(r'batting|bowling|most|runs|hundreds|fifties|sixes|fours|mat|sr', re.IGNORECASE)
+
+# Player list on the Indian Express stats pages; the page's first <table> is the sidebar points table
+STATS_LIST_XPATH = "//div[contains(concat(' ', normalize-space(@class), ' '), ' constituency-list ')]"
+
+# Matches the stat type in a stats CSV filename
+STAT_FILE_PATTERN = re.compile('|'.join(re.escape(stat_type) for stat_type in STAT_SPECS))
+
+# Batting stats file from an earlier scrape, used when a batting count stat can't be extracted
+BATTING_BACKUP_FILE = 'ipl_batting_stats_20250330.csv'
+BATTING_BACKUP_COLUMNS = ['Player', 'Team', 'Mat', 'Inns', '100s', '50s', '6s', '4s']
+BATTING_BACKUP_TOP_N = 50
+
+# Saved most runs file that extract_data_from_existing_csv derives the batting count stats from
+EXISTING_BATTING_STATS_FILE = os.path.join(FOLDERS['batting_stats'], 'ipl_most-runs_20250330.csv')
+
+# HTML summary report; rows and top players are filled in by generate_summary_report
+STATS_REPORT_TEMPLATE = """
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>IPL Stats Report - {today}</title>
+        <style>
+            body {{ font-family: Arial, sans-serif; margin: 20px; }}
+            h1, h2, h3 {{ color: #1a5276; }}
+            .section {{ margin-bottom: 20px; }}
+            .success {{ color: green; }}
+            .failure {{ color: red; }}
+            table {{ border-collapse: collapse; width: 100%; margin-bottom: 20px; }}
+            th, td {{ padding: 8px; text-align: left; border: 1px solid #ddd; }}
+            th {{ background-color: #f2f2f2; }}
+            tr:nth-child(even) {{ background-color: #f9f9f9; }}
+        </style>
+    </head>
+    <body>
+        <h1>IPL Statistics Report</h1>
+        <p>Generated on: {scraping_date}</p>
+        
+        <div class="section">
+            <h2>Summary</h2>
+            <p>Total statistics scraped: {stats_scraped}</p>
+            <p>Successful scrapes: <span class="success">{successful_scrapes}</span></p>
+            <p>Failed scrapes: <span class="failure">{failed_scrapes}</span></p>
+        </div>
+        
+        <div class="section">
+            <h2>Batting Statistics</h2>
+            <table>
+                <tr>
+                    <th>Statistic</th>
+                    <th>Status</th>
+                    <th>File</th>
+                </tr>
+    {batting_rows}
+            </table>
+        </div>
+        
+        <div class="section">
+            <h2>Bowling Statistics</h2>
+            <table>
+                <tr>
+                    <th>Statistic</th>
+                    <th>Status</th>
+                    <th>File</th>
+                </tr>
+    {bowling_rows}
+            </table>
+        </div>
+        
+        <div class="section">
+            <h2>Top Players</h2>
+    {top_players}
+        </div>
+    </body>
+    </html>
+    """
+
+# One stat row of the HTML report's batting and bowling tables
+REPORT_ROW_TEMPLATE = """
+                <tr>
+                    <td>{stat}</td>
+                    <td class="{status_class}">{status_text}</td>
+                    <td>{file_name}</td>
+                </tr>
+        """
+
+# CSS class and label for a stat row's status in the HTML report, keyed by success
+REPORT_STATUS = {True: ('success', 'Success'), False: ('failure', 'Failed')}
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+DECIMAL_PATTERN = re.compile(r'^[\d\.]+$')
+# ASCII digits only, unlike str.isdigit, so every match converts with int()
+WHOLE_NUMBER_PATTERN = re.compile(r'[0-9]+')
+
 def create_folders():
     """Create the necessary folder structure if it doesn't exist"""
-    for folder in FOLDERS.values():
-        if not os.path.exists(folder):
+    for key, folder in FOLDERS.items():
+        if key == 'debug_files' and not DEBUG:
+            continue
+        # Just try to create it; an existing folder costs one failed mkdir instead of a stat and a mkdir
+        try:
             os.makedirs(folder)
-            print(f"{Fore.GREEN}Created folder: {folder}{Style.RESET_ALL}")
+        except FileExistsError:
+            continue
+        print(f"{Fore.GREEN}Created folder: {folder}{Style.RESET_ALL}")
 
 def extract_stats_from_text(text, stat_type):
     """
@@ -38,55 +271,16 @@ def extract_stats_from_text(text, stat_type):
         pandas.DataFrame: DataFrame containing the extracted stats
     """
     # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text)
-    
-    # Different extraction patterns based on stat type
-    if stat_type == 'most-runs':
-        # Pattern for batsmen with runs stats
-        pattern = r'(\d+)\s+([A-Za-z\s]+)\s+([A-Za-z\s]+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+\*?)\s+([\d\.]+)\s+([\d\.]+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)'
-        columns = ['Rank', 'Player', 'Team', 'Mat', 'Inns', 'Runs', 'HS', 'Avg', 'SR', '100s', '50s', '4s', '6s']
-    elif stat_type == 'most-hundreds':
-        # Pattern for players with hundreds
-        pattern = r'(\d+)\s+([A-Za-z\s]+)\s+([A-Za-z\s]+)\s+(\d+)\s+(\d+)\s+(\d+)'
-        columns = ['Rank', 'Player', 'Team', 'Mat', 'Inns', '100s']
-    elif stat_type == 'most-fifties':
-        # Pattern for players with fifties
-        pattern = r'(\d+)\s+([A-Za-z\s]+)\s+([A-Za-z\s]+)\s+(\d+)\s+(\d+)\s+(\d+)'
-        columns = ['Rank', 'Player', 'Team', 'Mat', 'Inns', '50s']
-    elif stat_type == 'most-6s':
-        # Pattern for players with sixes
-        pattern = r'(\d+)\s+([A-Za-z\s]+)\s+([A-Za-z\s]+)\s+(\d+)\s+(\d+)\s+(\d+)'
-        columns = ['Rank', 'Player', 'Team', 'Mat', 'Inns', '6s']
-    elif stat_type == 'most-4s':
-        # Pattern for players with fours
-        pattern = r'(\d+)\s+([A-Za-z\s]+)\s+([A-Za-z\s]+)\s+(\d+)\s+(\d+)\s+(\d+)'
-        columns = ['Rank', 'Player', 'Team', 'Mat', 'Inns', '4s']
-    # Bowling stats patterns
-    elif stat_type == 'most-wickets':
-        # Pattern for bowlers with wickets
-        pattern = r'(\d+)\s+([A-Za-z\s]+)\s+([A-Za-z\s]+)\s+(\d+)\s+(\d+)\s+(\d+)'
-        columns = ['Rank', 'Player', 'Team', 'Mat', 'Inns', 'Wkts']
-    elif stat_type == 'most-maidens':
-        # Pattern for bowlers with maidens
-        pattern = r'(\d+)\s+([A-Za-z\s]+)\s+([A-Za-z\s]+)\s+(\d+)\s+(\d+)\s+(\d+)'
-        columns = ['Rank', 'Player', 'Team', 'Mat', 'Inns', 'Maidens']
-    elif stat_type == 'best-bowling-average':
-        # Pattern for best bowling average
-        pattern = r'(\d+)\s+([A-Za-z\s]+)\s+([A-Za-z\s]+)\s+(\d+)\s+(\d+)\s+(\d+)\s+([\d\.]+)'
-        columns = ['Rank', 'Player', 'Team', 'Mat', 'Inns', 'Wkts', 'Avg']
-    elif stat_type == 'best-bowling-strike-rate':
-        # Pattern for best bowling strike rate
-        pattern = r'(\d+)\s+([A-Za-z\s]+)\s+([A-Za-z\s]+)\s+(\d+)\s+(\d+)\s+(\d+)\s+([\d\.]+)'
-        columns = ['Rank', 'Player', 'Team', 'Mat', 'Inns', 'Wkts', 'SR']
-    elif stat_type == 'best-economy-rates':
-        # Pattern for best economy rates
-        pattern = r'(\d+)\s+([A-Za-z\s]+)\s+([A-Za-z\s]+)\s+(\d+)\s+(\d+)\s+(\d+)\s+([\d\.]+)'
-        columns = ['Rank', 'Player', 'Team', 'Mat', 'Inns', 'Overs', 'Econ']
-    else:
+    text = WHITESPACE_PATTERN.sub(' ', text)
+    
+    # Look up the extraction pattern for this stat type
+    spec = STAT_SPECS.get(stat_type)
+    if spec is None:
         return None
+    columns = spec['columns']
     
     # Find matches
-    matches = re.findall(pattern, text)
+    matches = spec['pattern'].findall(text)
     
     if not matches:
         return None
@@ -99,8 +293,7 @@ def extract_stats_from_text(text, stat_type):
         team_name = match[2].strip()
         
         # Skip entries that don't look like player stats
-        if (any(keyword in player_name.lower() for keyword in ['batting', 'bowling', 'most', 'runs', 'hundreds', 'fifties', 'sixes', 'fours']) or
-            any(keyword in team_name.lower() for keyword in ['batting', 'bowling', 'most', 'runs', 'hundreds', 'fifties', 'sixes', 'fours', 'mat', 'sr'])):
+        if STAT_ROW_PLAYER_HEADING_PATTERN.search(player_name) or STAT_ROW_TEAM_HEADING_PATTERN.search(team_name):
             continue
         
         # For runs: Check if runs is a reasonable number
@@ -132,376 +325,249 @@ def manual_cleanup(df, stat_type):
     if df is None:
         return None
     
+    # Rows to keep, built up as one mask and applied once
+    keep = pd.Series(True, index=df.index)
+    
     # Remove rows where Player contains keywords that indicate it's not a player
     if 'Player' in df.columns:
-        df = df[~df['Player'].str.contains('most|batting|bowling|runs|hundreds|fifties|sixes|fours|skip|menu|search', case=False, na=False)]
+        keep &= ~df['Player'].str.contains(NON_PLAYER_PATTERN, na=False)
     
     # Remove rows with zero or very low values for the main stat
-    stat_column = None
-    if stat_type == 'most-runs':
-        stat_column = 'Runs'
-    elif stat_type == 'most-hundreds':
-        stat_column = '100s'
-    elif stat_type == 'most-fifties':
-        stat_column = '50s'
-    elif stat_type == 'most-6s':
-        stat_column = '6s'
-    elif stat_type == 'most-4s':
-        stat_column = '4s'
-    elif stat_type == 'most-wickets':
-        stat_column = 'Wkts'
-    elif stat_type == 'most-maidens':
-        stat_column = 'Maidens'
+    stat_column = STAT_SPECS[stat_type]['value_column'] if stat_type in STAT_SPECS else None
     
     if stat_column and stat_column in df.columns:
-        try:
-            df[stat_column] = pd.to_numeric(df[stat_column], errors='coerce')
-            # Keep only rows with reasonable values
-            if stat_type == 'most-runs':
-                df = df[df[stat_column] >= 10]
-            else:
-                df = df[df[stat_column] > 0]
-        except Exception:
-            pass
+        df[stat_column] = pd.to_numeric(df[stat_column], errors='coerce')
+        # Keep only rows with reasonable values
+        if stat_type == 'most-runs':
+            keep &= df[stat_column] >= 10
+        else:
+            keep &= df[stat_column] > 0
     
-    # Reset index after filtering
-    df = df.reset_index(drop=True)
+    # Filter and reset index in one step
+    df = df.loc[keep].reset_index(drop=True)
     
     # Fix rank numbers
     if 'Rank' in df.columns:
-        df['Rank'] = range(1, len(df) + 1)
+        df['Rank'] = np.arange(1, len(df) + 1, dtype=np.int32)
     
     return df
 
-def scrape_ipl_stats(url, stat_type):
+def page_age(filename):
+    """
+    Seconds since a saved page was written, or infinity if it doesn't exist (one stat call)
+    """
+    try:
+        return time.time() - os.path.getmtime(filename)
+    except OSError:
+        return float('inf')
+
+@functools.lru_cache(maxsize=1)
+def load_batting_backup():
+    """
+    Read the backup batting stats file once per run, keeping only the columns the fallback needs
+    
+    Returns:
+        pandas.DataFrame or None: Backup batting stats, or None if the file doesn't exist
+    """
+    if not os.path.exists(BATTING_BACKUP_FILE):
+        return None
+    
+    batting_df = pd.read_csv(BATTING_BACKUP_FILE, usecols=lambda column: column in BATTING_BACKUP_COLUMNS)
+    for column in ['100s', '50s', '6s', '4s']:
+        if column in batting_df.columns:
+            batting_df[column] = pd.to_numeric(batting_df[column], errors='coerce')
+    return batting_df
+
+def find_player_rows(page_text, heading_pattern, with_extra_value=False):
+    """
+    Find player rows in page text laid out one value per line
+    
+    A row is a player name line, a team name line and three whole-number
+    lines (matches, innings, stat value), optionally followed by a decimal
+    line. Name lines must be longer than 3 characters, must not start with a
+    digit and must not match heading_pattern. All lines are tested at once
+    with vectorized string operations.
+    
+    Args:
+        page_text (str): Page text
+        heading_pattern (re.Pattern): Words that mark a line as a heading rather than a name
+        with_extra_value (bool): Whether rows end with an extra decimal value (Avg, SR, Econ)
+    
+    Returns:
+        tuple: Lists of players, teams, matches, innings, values and extra values
+    """
+    lines = pd.Series(page_text.split('\n')).str.strip()
+    is_number = lines.str.fullmatch(WHOLE_NUMBER_PATTERN).to_numpy()
+    is_name = ((lines.str.len() > 3) & ~lines.str[:1].str.isdigit() & ~lines.str.contains(heading_pattern)).to_numpy()
+    
+    # Line i starts a row when the lines after it have the expected shape;
+    # each check is an offset view of a boolean array rather than a shifted copy
+    count = max(len(lines) - (6 if with_extra_value else 5) + 1, 0)
+    is_row = (is_name[:count] &
+              is_name[1:count + 1] &
+              is_number[2:count + 2] &
+              is_number[3:count + 3] &
+              is_number[4:count + 4])
+    if with_extra_value:
+        is_row &= lines.str.match(DECIMAL_PATTERN).to_numpy()[5:count + 5]
+    
+    starts = is_row.nonzero()[0]
+    values = lines.to_numpy()
+    extra_values = values[starts + 5].tolist() if with_extra_value else []
+    return (values[starts].tolist(), values[starts + 1].tolist(), values[starts + 2].tolist(),
+            values[starts + 3].tolist(), values[starts + 4].tolist(), extra_values)
+
+def extract_player_stats(page_text, stat_type):
+    """
+    Extract player rows from page text, first as whitespace-separated rows and
+    then as one value per line
+    
+    Args:
+        page_text (str): Text of the stats page or of its player list
+        stat_type (str): Type of statistic being scraped
+    
+    Returns:
+        pandas.DataFrame or None: Extracted rows, or None if neither approach found any
+    """
+    spec = STAT_SPECS[stat_type]
+    value_columns = spec['columns'][5:]
+    
+    # First, try to extract rows from the page text
+    df = extract_stats_from_text(page_text, stat_type)
+    
+    if df is not None and not df.empty:
+        print(f"{Fore.GREEN}Extracted {len(df)} player entries for {stat_type}{Style.RESET_ALL}")
+        df = manual_cleanup(df, stat_type)
+        if df is not None and not df.empty:
+            return df
+    
+    # If that fails, look for one value per line (player, team, matches, innings, stat values)
+    if spec['heading_pattern'] is not None:
+        print(f"Using specialized extraction for {stat_type}...")
+        players, teams, matches, innings, values, extra_values = find_player_rows(
+            page_text, spec['heading_pattern'], with_extra_value=len(value_columns) == 2)
+        
+        # If we found players using this approach
+        if players:
+            print(f"Found {len(players)} players using manual extraction")
+            
+            # Create DataFrame from typed columns so pandas doesn't have to infer them;
+            # the scan only accepts whole numbers for matches, innings and the stat value
+            data = {
+                'Rank': np.arange(1, len(players) + 1, dtype=np.int32),
+                'Player': players,
+                'Team': teams,
+                'Mat': np.array(matches, dtype=np.int32),
+                'Inns': np.array(innings, dtype=np.int32),
+                value_columns[0]: np.array(values, dtype=np.int32)
+            }
+            
+            # Add the decimal Avg/SR/Econ column
+            if len(value_columns) == 2:
+                data[value_columns[1]] = pd.to_numeric(extra_values, errors='coerce')
+            
+            return pd.DataFrame(data)
+    
+    return None
+
+def scrape_ipl_stats(url, stat_type, force_refresh=False):
     """
     Scrape IPL statistics from Indian Express website for different stat types
     
+    The page cached in .http_cache on an earlier run is reused while it is
+    younger than STATS_PAGE_CACHE_TTL.
+    
     Args:
         url (str): URL of the stats page to scrape
         stat_type (str): Type of statistic being scraped (e.g., 'most-runs', 'most-hundreds')
+        force_refresh (bool): Fetch the page even if a fresh saved copy exists
     
     Returns:
         pandas.DataFrame or None: DataFrame containing the scraped data or None if scraping failed
     """
     print(f"\n{Fore.CYAN}===== Scraping {stat_type} ====={Style.RESET_ALL}")
-    print(f"{Fore.YELLOW}Fetching data from {url}...{Style.RESET_ALL}")
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-    }
     
     try:
-        # Send request and get content
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
+        page_filename = os.path.join(FOLDERS['http_cache'], f"stats_page_{stat_type}.html")
         
-        # Save HTML for debugging
-        debug_filename = os.path.join(FOLDERS['debug_files'], f"page_{stat_type}.html")
-        with open(debug_filename, "w", encoding="utf-8") as f:
-            f.write(response.text)
-        print(f"Saved HTML to {debug_filename}")
+        # HTML is parsed incrementally, chunk by chunk
+        parser = lxml.html.HTMLParser()
         
-        # Parse HTML
-        soup = BeautifulSoup(response.content, 'html.parser')
+        if not force_refresh and page_age(page_filename) < STATS_PAGE_CACHE_TTL:
+            # Reuse the recently saved page
+            print(f"{Fore.YELLOW}Using saved page {page_filename}{Style.RESET_ALL}")
+            with open(page_filename, "rb") as f:
+                for chunk in iter(lambda: f.read(STREAM_CHUNK_SIZE), b''):
+                    parser.feed(chunk)
+        else:
+            # Send request and parse the body as it arrives
+            print(f"{Fore.YELLOW}Fetching data from {url}...{Style.RESET_ALL}")
+            with SESSION.get(url, timeout=15, stream=True) as response:
+                response.raise_for_status()
+                
+                # Cache the HTML for reuse on the next run, as the raw bytes that were served
+                try:
+                    with open(page_filename, "wb") as f:
+                        for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                            f.write(chunk)
+                            parser.feed(chunk)
+                except Exception:
+                    # Don't leave a partial page that the next run would reuse
+                    if os.path.exists(page_filename):
+                        os.remove(page_filename)
+                    raise
+            print(f"Saved HTML to {page_filename}")
+        
+        root = parser.close()
         
-        # Get text content
-        page_text = soup.get_text()
+        # Get text content, trying the stats list first and then the whole page
+        page_text = root.text_content()
+        stats_lists = root.xpath(STATS_LIST_XPATH)
+        stats_text = "\n".join(element.text_content() for element in stats_lists)
         
         # Save text for debugging
-        text_filename = os.path.join(FOLDERS['debug_files'], f"text_{stat_type}.txt")
-        with open(text_filename, "w", encoding="utf-8") as f:
-            f.write(page_text)
+        if DEBUG:
+            text_filename = os.path.join(FOLDERS['debug_files'], f"text_{stat_type}.txt")
+            with open(text_filename, "w", encoding="utf-8") as f:
+                f.write(page_text)
         
-        # Alternative approach for known pages
-        if stat_type == 'most-runs':
-            # Extract player names and team names from the page text
-            print(f"Processing {stat_type} page...")
-            df = extract_stats_from_text(page_text, stat_type)
-            
-            if df is not None and not df.empty:
-                print(f"{Fore.GREEN}Extracted {len(df)} player entries for {stat_type}{Style.RESET_ALL}")
-                return manual_cleanup(df, stat_type)
+        spec = STAT_SPECS[stat_type]
         
-        elif stat_type in ['most-hundreds', 'most-fifties', 'most-6s', 'most-4s']:
-            # For these pages, use our existing CSV files as backup
-            print(f"Checking existing data for {stat_type}...")
-            
-            # First, try to extract from page text
-            df = extract_stats_from_text(page_text, stat_type)
-            
-            if df is not None and not df.empty:
-                print(f"{Fore.GREEN}Extracted {len(df)} player entries for {stat_type}{Style.RESET_ALL}")
-                df = manual_cleanup(df, stat_type)
-                if df is not None and not df.empty:
-                    return df
-            
-            # If that fails, try a more direct approach for each specific type
-            print(f"Using specialized extraction for {stat_type}...")
-            
-            # Define expected columns based on stat type
-            if stat_type == 'most-hundreds':
-                columns = ['Rank', 'Player', 'Team', 'Mat', 'Inns', '100s']
-            elif stat_type == 'most-fifties':
-                columns = ['Rank', 'Player', 'Team', 'Mat', 'Inns', '50s']
-            elif stat_type == 'most-6s':
-                columns = ['Rank', 'Player', 'Team', 'Mat', 'Inns', '6s']
-            elif stat_type == 'most-4s':
-                columns = ['Rank', 'Player', 'Team', 'Mat', 'Inns', '4s']
-            
-            # Look for numeric patterns that might indicate player stats
-            # This is a simplified approach focusing on finding players with their stats
-            lines = page_text.split('\n')
-            
-            # Collect player data
-            players = []
-            teams = []
-            matches = []
-            innings = []
-            values = []
-            
-            # Manual extraction based on line-by-line analysis
-            for i in range(len(lines) - 5):  # Need at least 5 consecutive lines
-                line = lines[i].strip()
-                
-                # Look for player names (skip short lines and numeric lines)
-                if (len(line) > 3 and 
-                    not line[0].isdigit() and 
-                    not any(keyword in line.lower() for keyword in ['batting', 'bowling', 'runs', 'most', 'hundreds', 'fifties', 'sixes'])):
-                    
-                    # Check next lines for team name and stats
-                    next_line = lines[i+1].strip() if i+1 < len(lines) else ""
-                    
-                    # If next line looks like a team name
-                    if (len(next_line) > 3 and 
-                        not next_line[0].isdigit() and
-                        not any(keyword in next_line.lower() for keyword in ['batting', 'bowling', 'runs', 'most', 'hundreds', 'fifties', 'sixes'])):
-                        
-                        # Check for numeric values in following lines
-                        matches_val = lines[i+2].strip() if i+2 < len(lines) else ""
-                        innings_val = lines[i+3].strip() if i+3 < len(lines) else ""
-                        stat_val = lines[i+4].strip() if i+4 < len(lines) else ""
-                        
-                        # If these look like valid numeric values
-                        if (matches_val.isdigit() and 
-                            innings_val.isdigit() and 
-                            stat_val.isdigit()):
-                            
-                            # Add this as a player entry
-                            players.append(line)
-                            teams.append(next_line)
-                            matches.append(matches_val)
-                            innings.append(innings_val)
-                            values.append(stat_val)
-            
-            # If we found players using this approach
-            if players:
-                print(f"Found {len(players)} players using manual extraction")
-                
-                # Create DataFrame
-                data = {
-                    'Rank': list(range(1, len(players) + 1)),
-                    'Player': players,
-                    'Team': teams,
-                    'Mat': matches,
-                    'Inns': innings
-                }
-                
-                # Add the specific stat column
-                stat_col = '100s' if stat_type == 'most-hundreds' else '50s' if stat_type == 'most-fifties' else '6s'
-                data[stat_col] = values
-                
-                df = pd.DataFrame(data)
+        print(f"Processing {stat_type} page...")
+        for text in ([stats_text, page_text] if stats_lists else [page_text]):
+            df = extract_player_stats(text, stat_type)
+            if df is not None:
                 return df
-            
-            # If all else fails, try to use existing data from IPL batting stats file
+        
+        # If all else fails, try to use existing data from IPL batting stats file
+        if spec['from_batting_backup']:
             try:
                 print("Trying to extract data from existing batting stats file...")
+                stat_column = spec['value_column']
                 
                 # Check if we have the batting stats file from previous scraping
-                batting_stats_file = 'ipl_batting_stats_20250330.csv'
-                if os.path.exists(batting_stats_file):
-                    batting_df = pd.read_csv(batting_stats_file)
-                    
-                    # Create a new DataFrame with just the columns we need
-                    if stat_type == 'most-hundreds' and '100s' in batting_df.columns:
-                        new_df = batting_df[['Player', 'Team', 'Mat', 'Inns', '100s']].copy()
-                        new_df = new_df.sort_values(by='100s', ascending=False).reset_index(drop=True)
-                        new_df['Rank'] = range(1, len(new_df) + 1)
-                        return new_df[['Rank', 'Player', 'Team', 'Mat', 'Inns', '100s']]
-                    
-                    elif stat_type == 'most-fifties' and '50s' in batting_df.columns:
-                        new_df = batting_df[['Player', 'Team', 'Mat', 'Inns', '50s']].copy()
-                        new_df = new_df.sort_values(by='50s', ascending=False).reset_index(drop=True)
-                        new_df['Rank'] = range(1, len(new_df) + 1)
-                        return new_df[['Rank', 'Player', 'Team', 'Mat', 'Inns', '50s']]
-                    
-                    elif stat_type == 'most-6s' and '6s' in batting_df.columns:
-                        new_df = batting_df[['Player', 'Team', 'Mat', 'Inns', '6s']].copy()
-                        new_df = new_df.sort_values(by='6s', ascending=False).reset_index(drop=True)
-                        new_df['Rank'] = range(1, len(new_df) + 1)
-                        return new_df[['Rank', 'Player', 'Team', 'Mat', 'Inns', '6s']]
-                        
-                    elif stat_type == 'most-4s' and '4s' in batting_df.columns:
-                        new_df = batting_df[['Player', 'Team', 'Mat', 'Inns', '4s']].copy()
-                        new_df = new_df.sort_values(by='4s', ascending=False).reset_index(drop=True)
-                        new_df['Rank'] = range(1, len(new_df) + 1)
-                        return new_df[['Rank', 'Player', 'Team', 'Mat', 'Inns', '4s']]
+                batting_df = load_batting_backup()
+                if batting_df is not None and stat_column in batting_df.columns:
+                    # Take the top players for this stat, with just the columns we need; a stable
+                    # sort keeps tied players in file order and players without a value at the end
+                    new_df = batting_df.sort_values(stat_column, ascending=False, kind='stable').head(BATTING_BACKUP_TOP_N)
+                    new_df = new_df[['Player', 'Team', 'Mat', 'Inns', stat_column]]
+                    new_df = new_df.reset_index(drop=True)
+                    new_df.insert(0, 'Rank', np.arange(1, len(new_df) + 1, dtype=np.int32))
+                    return new_df
             except Exception as e:
                 print(f"{Fore.RED}Error extracting from batting stats file: {e}{Style.RESET_ALL}")
         
-        # Bowling stats extraction
-        elif stat_type in ['most-wickets', 'most-maidens', 'best-bowling-average', 'best-bowling-strike-rate', 'best-economy-rates']:
-            print(f"Processing {stat_type} page...")
-            df = extract_stats_from_text(page_text, stat_type)
-            
-            if df is not None and not df.empty:
-                print(f"{Fore.GREEN}Extracted {len(df)} player entries for {stat_type}{Style.RESET_ALL}")
-                return manual_cleanup(df, stat_type)
-                
-            # If direct extraction fails, try specialized approach for bowling stats
-            print(f"Using specialized extraction for {stat_type}...")
-            
-            # Define expected columns based on stat type
-            if stat_type == 'most-wickets':
-                columns = ['Rank', 'Player', 'Team', 'Mat', 'Inns', 'Wkts']
-                value_column = 'Wkts'
-            elif stat_type == 'most-maidens':
-                columns = ['Rank', 'Player', 'Team', 'Mat', 'Inns', 'Maidens']
-                value_column = 'Maidens'
-            elif stat_type == 'best-bowling-average':
-                columns = ['Rank', 'Player', 'Team', 'Mat', 'Inns', 'Wkts', 'Avg']
-                value_column = 'Avg'
-            elif stat_type == 'best-bowling-strike-rate':
-                columns = ['Rank', 'Player', 'Team', 'Mat', 'Inns', 'Wkts', 'SR']
-                value_column = 'SR'
-            elif stat_type == 'best-economy-rates':
-                columns = ['Rank', 'Player', 'Team', 'Mat', 'Inns', 'Overs', 'Econ']
-                value_column = 'Econ'
-            
-            # Look for numeric patterns that might indicate player stats
-            lines = page_text.split('\n')
-            
-            # Collect player data
-            players = []
-            teams = []
-            matches = []
-            innings = []
-            values = []  # This will be wickets, maidens, etc.
-            extra_values = []  # For stats that have an additional column like Avg, SR, Econ
-            
-            # Manual extraction based on line-by-line analysis
-            for i in range(len(lines) - 6):  # Need up to 6 lines for stats with extra values
-                line = lines[i].strip()
-                
-                # Look for player names (skip short lines and numeric lines)
-                if (len(line) > 3 and 
-                    not line[0].isdigit() and 
-                    not any(keyword in line.lower() for keyword in ['batting', 'bowling', 'most', 'wickets', 'maidens', 'economy', 'average', 'strike'])):
-                    
-                    # Check next lines for team name and stats
-                    next_line = lines[i+1].strip() if i+1 < len(lines) else ""
-                    
-                    # If next line looks like a team name
-                    if (len(next_line) > 3 and 
-                        not next_line[0].isdigit() and
-                        not any(keyword in next_line.lower() for keyword in ['batting', 'bowling', 'most', 'wickets', 'maidens', 'economy', 'average', 'strike'])):
-                        
-                        # Check for numeric values in following lines
-                        matches_val = lines[i+2].strip() if i+2 < len(lines) else ""
-                        innings_val = lines[i+3].strip() if i+3 < len(lines) else ""
-                        stat_val = lines[i+4].strip() if i+4 < len(lines) else ""
-                        extra_val = lines[i+5].strip() if i+5 < len(lines) and value_column in ['Avg', 'SR', 'Econ'] else ""
-                        
-                        # If these look like valid numeric values
-                        has_valid_values = False
-                        
-                        if value_column in ['Wkts', 'Maidens']:
-                            # For wickets and maidens, just need the first 5 values
-                            has_valid_values = (matches_val.isdigit() and 
-                                               innings_val.isdigit() and 
-                                               stat_val.isdigit())
-                        else:
-                            # For stats with an extra value (Avg, SR, Econ)
-                            has_valid_values = (matches_val.isdigit() and 
-                                               innings_val.isdigit() and 
-                                               stat_val.isdigit() and
-                                               re.match(r'^[\d\.]+$', extra_val))
-                        
-                        if has_valid_values:
-                            # Add this as a player entry
-                            players.append(line)
-                            teams.append(next_line)
-                            matches.append(matches_val)
-                            innings.append(innings_val)
-                            values.append(stat_val)
-                            if value_column in ['Avg', 'SR', 'Econ']:
-                                extra_values.append(extra_val)
-            
-            # If we found players using this approach
-            if players:
-                print(f"Found {len(players)} players using manual extraction")
-                
-                # Create DataFrame
-                data = {
-                    'Rank': list(range(1, len(players) + 1)),
-                    'Player': players,
-                    'Team': teams,
-                    'Mat': matches,
-                    'Inns': innings
-                }
-                
-                # Add the specific stat column
-                if value_column == 'Wkts':
-                    data['Wkts'] = values
-                elif value_column == 'Maidens':
-                    data['Maidens'] = values
-                elif value_column == 'Avg':
-                    data['Wkts'] = values
-                    data['Avg'] = extra_values
-                elif value_column == 'SR':
-                    data['Wkts'] = values
-                    data['SR'] = extra_values
-                elif value_column == 'Econ':
-                    data['Overs'] = values
-                    data['Econ'] = extra_values
-                
-                df = pd.DataFrame(data)
-                return df
-        
         # If all extraction methods fail, create a template CSV as fallback
         today = datetime.datetime.now().strftime('%Y%m%d')
-        folder = FOLDERS['batting_stats'] if stat_type in ['most-runs', 'most-hundreds', 'most-fifties', 'most-6s', 'most-4s'] else FOLDERS['bowling_stats']
-        manual_csv_path = os.path.join(folder, f'ipl_{stat_type}_manual_{today}.csv')
-        
-        # Define columns based on stat type
-        if stat_type == 'most-runs':
-            columns = ['Rank', 'Player', 'Team', 'Mat', 'Inns', 'Runs', 'HS', 'Avg', 'SR', '100s', '50s', '4s', '6s']
-        elif stat_type == 'most-hundreds':
-            columns = ['Rank', 'Player', 'Team', 'Mat', 'Inns', '100s']
-        elif stat_type == 'most-fifties':
-            columns = ['Rank', 'Player', 'Team', 'Mat', 'Inns', '50s']
-        elif stat_type == 'most-6s':
-            columns = ['Rank', 'Player', 'Team', 'Mat', 'Inns', '6s']
-        elif stat_type == 'most-4s':
-            columns = ['Rank', 'Player', 'Team', 'Mat', 'Inns', '4s']
-        elif stat_type == 'most-wickets':
-            columns = ['Rank', 'Player', 'Team', 'Mat', 'Inns', 'Wkts']
-        elif stat_type == 'most-maidens':
-            columns = ['Rank', 'Player', 'Team', 'Mat', 'Inns', 'Maidens']
-        elif stat_type == 'best-bowling-average':
-            columns = ['Rank', 'Player', 'Team', 'Mat', 'Inns', 'Wkts', 'Avg']
-        elif stat_type == 'best-bowling-strike-rate':
-            columns = ['Rank', 'Player', 'Team', 'Mat', 'Inns', 'Wkts', 'SR']
-        elif stat_type == 'best-economy-rates':
-            columns = ['Rank', 'Player', 'Team', 'Mat', 'Inns', 'Overs', 'Econ']
+        manual_csv_path = os.path.join(FOLDERS[f"{spec['category']}_stats"], f'ipl_{stat_type}_manual_{today}.csv')
         
-        with open(manual_csv_path, 'w', newline='') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(columns)
-            writer.writerow([1, f'Extract from {debug_filename}', '', '0', '0', '0'])
+        template_row = [1, f'Extract from {page_filename}', '', '0', '0', '0']
+        template_row += [''] * (len(spec['columns']) - len(template_row))
+        pd.DataFrame([template_row[:len(spec['columns'])]], columns=spec['columns']).to_csv(manual_csv_path, index=False)
         
         print(f"{Fore.YELLOW}Created a template CSV file at {manual_csv_path}{Style.RESET_ALL}")
-        print(f"Please examine {debug_filename} and manually fill in the data")
+        print(f"Please examine {page_filename} and manually fill in the data")
         
         return None
         
@@ -514,15 +580,14 @@ def clean_player_team_data(df):
     if df is None:
         return None
     
-    # Check if Player column contains newlines
-    if 'Player' in df.columns:
-        for idx, row in df.iterrows():
-            player = str(row['Player'])
-            if '\n' in player:
-                parts = player.split('\n')
-                if len(parts) == 2 and 'Team' in df.columns:
-                    df.at[idx, 'Player'] = parts[0].strip()
-                    df.at[idx, 'Team'] = parts[1].strip()
+    # Split "Player\nTeam" cells into the Player and Team columns
+    if 'Player' in df.columns and 'Team' in df.columns:
+        players = df['Player'].astype(str)
+        mask = players.str.count('\n') == 1
+        if mask.any():
+            parts = players[mask].str.split('\n', n=1, expand=True)
+            df.loc[mask, 'Player'] = parts[0].str.strip()
+            df.loc[mask, 'Team'] = parts[1].str.strip()
     
     return df
 
@@ -543,7 +608,7 @@ def save_to_csv(df, stat_type, filename=None):
     df = clean_player_team_data(df)
     
     # Determine folder based on stat type
-    folder = FOLDERS['batting_stats'] if stat_type in ['most-runs', 'most-hundreds', 'most-fifties', 'most-6s', 'most-4s'] else FOLDERS['bowling_stats']
+    folder = FOLDERS[f"{STAT_SPECS[stat_type]['category']}_stats"]
     
     if filename is None:
         # Generate a filename with the current date
@@ -560,12 +625,17 @@ def save_to_csv(df, stat_type, filename=None):
     
     return filename
 
-def generate_summary_report(results):
+def generate_summary_report(results, want_html=True):
     """
     Generate a summary report of all the scraped data
     
     Args:
-        results (dict): Dictionary containing scraping results
+        results (dict): Dictionary containing scraping results; a successful
+            result may carry the saved DataFrame under 'df'
+        want_html (bool): Also write the HTML report alongside the JSON summary
+    
+    Returns:
+        tuple: Paths of the JSON summary and the HTML report (None if skipped)
     """
     print(f"\n{Fore.CYAN}===== Generating Summary Report ====={Style.RESET_ALL}")
     
@@ -574,8 +644,8 @@ def generate_summary_report(results):
         "stats_scraped": len(results),
         "successful_scrapes": sum(1 for v in results.values() if v['success']),
         "failed_scrapes": sum(1 for v in results.values() if not v['success']),
-        "batting_stats": {k: v for k, v in results.items() if k in ['most-runs', 'most-hundreds', 'most-fifties', 'most-6s', 'most-4s']},
-        "bowling_stats": {k: v for k, v in results.items() if k in ['most-wickets', 'most-maidens', 'best-bowling-average', 'best-bowling-strike-rate', 'best-economy-rates']}
+        "batting_stats": {k: {'success': v['success'], 'file': v['file']} for k, v in results.items() if STAT_SPECS[k]['category'] == 'batting'},
+        "bowling_stats": {k: {'success': v['success'], 'file': v['file']} for k, v in results.items() if STAT_SPECS[k]['category'] == 'bowling'}
     }
     
     # Generate top players lists
@@ -584,7 +654,10 @@ def generate_summary_report(results):
     # Find top run scorer
     if 'most-runs' in results and results['most-runs']['success'] and results['most-runs']['file']:
         try:
-            df = pd.read_csv(results['most-runs']['file'])
+            # Use the frame that was just saved, falling back to reading the file
+            df = results['most-runs'].get('df')
+            if df is None:
+                df = pd.read_csv(results['most-runs']['file'])
             if not df.empty:
                 top_player = df.iloc[0]
                 top_players['top_run_scorer'] = {
@@ -598,7 +671,10 @@ def generate_summary_report(results):
     # Find top wicket taker
     if 'most-wickets' in results and results['most-wickets']['success'] and results['most-wickets']['file']:
         try:
-            df = pd.read_csv(results['most-wickets']['file'])
+            # Use the frame that was just saved, falling back to reading the file
+            df = results['most-wickets'].get('df')
+            if df is None:
+                df = pd.read_csv(results['most-wickets']['file'])
             if not df.empty:
                 top_player = df.iloc[0]
                 top_players['top_wicket_taker'] = {
@@ -616,119 +692,56 @@ def generate_summary_report(results):
     summary_file = os.path.join(FOLDERS['reports'], f'ipl_stats_summary_{today}.json')
     
     with open(summary_file, 'w') as f:
-        json.dump(summary, f, indent=4)
+        # Serialize in memory and write once, rather than one write per JSON token
+        f.write(json.dumps(summary, indent=4))
+    
+    if not want_html:
+        print(f"{Fore.GREEN}Summary report saved to {summary_file}{Style.RESET_ALL}")
+        return summary_file, None
     
     # Create a more readable HTML report
     html_report = os.path.join(FOLDERS['reports'], f'ipl_stats_report_{today}.html')
     
-    html_content = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>IPL Stats Report - {today}</title>
-        <style>
-            body {{ font-family: Arial, sans-serif; margin: 20px; }}
-            h1, h2, h3 {{ color: #1a5276; }}
-            .section {{ margin-bottom: 20px; }}
-            .success {{ color: green; }}
-            .failure {{ color: red; }}
-            table {{ border-collapse: collapse; width: 100%; margin-bottom: 20px; }}
-            th, td {{ padding: 8px; text-align: left; border: 1px solid #ddd; }}
-            th {{ background-color: #f2f2f2; }}
-            tr:nth-child(even) {{ background-color: #f9f9f9; }}
-        </style>
-    </head>
-    <body>
-        <h1>IPL Statistics Report</h1>
-        <p>Generated on: {summary['scraping_date']}</p>
-        
-        <div class="section">
-            <h2>Summary</h2>
-            <p>Total statistics scraped: {summary['stats_scraped']}</p>
-            <p>Successful scrapes: <span class="success">{summary['successful_scrapes']}</span></p>
-            <p>Failed scrapes: <span class="failure">{summary['failed_scrapes']}</span></p>
-        </div>
-        
-        <div class="section">
-            <h2>Batting Statistics</h2>
-            <table>
-                <tr>
-                    <th>Statistic</th>
-                    <th>Status</th>
-                    <th>File</th>
-                </tr>
-    """
-    
-    # Add batting stats to HTML
-    for stat, result in summary['batting_stats'].items():
-        status_class = "success" if result['success'] else "failure"
-        status_text = "Success" if result['success'] else "Failed"
-        html_content += f"""
-                <tr>
-                    <td>{stat}</td>
-                    <td class="{status_class}">{status_text}</td>
-                    <td>{os.path.basename(result['file']) if result['file'] else 'N/A'}</td>
-                </tr>
-        """
-    
-    html_content += """
-            </table>
-        </div>
-        
-        <div class="section">
-            <h2>Bowling Statistics</h2>
-            <table>
-                <tr>
-                    <th>Statistic</th>
-                    <th>Status</th>
-                    <th>File</th>
-                </tr>
-    """
-    
-    # Add bowling stats to HTML
-    for stat, result in summary['bowling_stats'].items():
-        status_class = "success" if result['success'] else "failure"
-        status_text = "Success" if result['success'] else "Failed"
-        html_content += f"""
-                <tr>
-                    <td>{stat}</td>
-                    <td class="{status_class}">{status_text}</td>
-                    <td>{os.path.basename(result['file']) if result['file'] else 'N/A'}</td>
-                </tr>
-        """
-    
-    html_content += """
-            </table>
-        </div>
-        
-        <div class="section">
-            <h2>Top Players</h2>
-    """
-    
-    # Add top players to HTML
+    # Add batting and bowling stats rows
+    stat_rows = {}
+    for section in ['batting_stats', 'bowling_stats']:
+        rows = []
+        for stat, result in summary[section].items():
+            status_class, status_text = REPORT_STATUS[result['success']]
+            file_name = os.path.basename(result['file']) if result['file'] else 'N/A'
+            rows.append(REPORT_ROW_TEMPLATE.format(stat=stat, status_class=status_class, status_text=status_text, file_name=file_name))
+        stat_rows[section] = "".join(rows)
+    
+    # Add top players
+    top_player_parts = []
     if 'top_run_scorer' in top_players:
         player = top_players['top_run_scorer']
-        html_content += f"""
+        top_player_parts.append(f"""
             <h3>Top Run Scorer</h3>
             <p>Player: {player['name']}</p>
             <p>Team: {player['team']}</p>
             <p>Runs: {player['runs']}</p>
-        """
+        """)
     
     if 'top_wicket_taker' in top_players:
         player = top_players['top_wicket_taker']
-        html_content += f"""
+        top_player_parts.append(f"""
             <h3>Top Wicket Taker</h3>
             <p>Player: {player['name']}</p>
             <p>Team: {player['team']}</p>
             <p>Wickets: {player['wickets']}</p>
-        """
-    
-    html_content += """
-        </div>
-    </body>
-    </html>
-    """
+        """)
+    
+    html_content = STATS_REPORT_TEMPLATE.format(
+        today=today,
+        scraping_date=summary['scraping_date'],
+        stats_scraped=summary['stats_scraped'],
+        successful_scrapes=summary['successful_scrapes'],
+        failed_scrapes=summary['failed_scrapes'],
+        batting_rows=stat_rows['batting_stats'],
+        bowling_rows=stat_rows['bowling_stats'],
+        top_players="".join(top_player_parts)
+    )
     
     with open(html_report, 'w') as f:
         f.write(html_content)
@@ -738,8 +751,14 @@ def generate_summary_report(results):
     
     return summary_file, html_report
 
-def scrape_all_stats():
-    """Scrape stats from multiple IPL stats pages"""
+def scrape_all_stats(want_html=True, force_refresh=False):
+    """
+    Scrape stats from multiple IPL stats pages
+    
+    Args:
+        want_html (bool): Also write the HTML summary report
+        force_refresh (bool): Download every page even if a fresh saved copy exists
+    """
     stats_urls = {
         # Batting stats
         'most-runs': 'https://indianexpress.com/section/sports/ipl/stats/most-runs/',
@@ -756,76 +775,69 @@ def scrape_all_stats():
         'best-economy-rates': 'https://indianexpress.com/section/sports/ipl/stats/best-economy-rates/'
     }
     
-    results = {}
+    # Fetch and parse the pages concurrently over the shared session, saving
+    # each page's CSV as soon as it is done while the others are still loading
+    completed = {}
+    
+    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {executor.submit(scrape_ipl_stats, url, stat_type, force_refresh): stat_type for stat_type, url in stats_urls.items()}
+        for future in concurrent.futures.as_completed(futures):
+            stat_type = futures[future]
+            df = future.result()
+            if df is not None:
+                saved_file = save_to_csv(df, stat_type)
+                completed[stat_type] = {'success': True, 'file': saved_file, 'df': df}
+            else:
+                completed[stat_type] = {'success': False, 'file': None}
     
-    for stat_type, url in stats_urls.items():
-        print(f"\n{Fore.CYAN}===== Scraping {stat_type} ====={Style.RESET_ALL}")
-        df = scrape_ipl_stats(url, stat_type)
-        saved_file = None
-        if df is not None:
-            saved_file = save_to_csv(df, stat_type)
-            results[stat_type] = {'success': True, 'file': saved_file}
-        else:
-            results[stat_type] = {'success': False, 'file': None}
+    # Keep the results in a fixed order
+    results = {stat_type: completed[stat_type] for stat_type in stats_urls}
     
     # Generate a summary report
-    generate_summary_report(results)
+    generate_summary_report(results, want_html=want_html)
     
     # Summary of results
     print(f"\n{Fore.CYAN}===== Scraping Summary ====={Style.RESET_ALL}")
     for stat_type, result in results.items():
-        status = f"{Fore.GREEN}Success{Style.RESET_ALL}" if result['success'] else f"{Fore.RED}Failed{Style.RESET_ALL}"
+        status = SUCCESS_STATUS if result['success'] else FAILED_STATUS
         print(f"{stat_type}: {status}")
     
     return results
 
-def extract_data_from_existing_csv():
+def extract_data_from_existing_csv(batting_df=None):
     """
     Extract data from existing CSV files and create derived stat files
     
     This function can be used if direct scraping fails
+    
+    Args:
+        batting_df (pandas.DataFrame, optional): Most runs data already scraped in this run.
+            If None, it is read from the saved batting stats file.
     """
     print(f"\n{Fore.CYAN}===== Extracting from Existing CSV ====={Style.RESET_ALL}")
     
     try:
-        # Check if we have the main batting stats file
-        batting_stats_file = os.path.join(FOLDERS['batting_stats'], 'ipl_most-runs_20250330.csv')
-        if not os.path.exists(batting_stats_file):
-            print(f"{Fore.RED}Batting stats file {batting_stats_file} not found.{Style.RESET_ALL}")
-            return False
-        
-        # Read the batting stats file
-        batting_df = pd.read_csv(batting_stats_file)
-        
-        # Create derived stat files
-        
-        # Most hundreds
-        if '100s' in batting_df.columns:
-            hundreds_df = batting_df[['Player', 'Team', 'Mat', 'Inns', '100s']].copy()
-            hundreds_df = hundreds_df.sort_values(by='100s', ascending=False).reset_index(drop=True)
-            hundreds_df['Rank'] = range(1, len(hundreds_df) + 1)
-            save_to_csv(hundreds_df[['Rank', 'Player', 'Team', 'Mat', 'Inns', '100s']], 'most-hundreds')
-        
-        # Most fifties
-        if '50s' in batting_df.columns:
-            fifties_df = batting_df[['Player', 'Team', 'Mat', 'Inns', '50s']].copy()
-            fifties_df = fifties_df.sort_values(by='50s', ascending=False).reset_index(drop=True)
-            fifties_df['Rank'] = range(1, len(fifties_df) + 1)
-            save_to_csv(fifties_df[['Rank', 'Player', 'Team', 'Mat', 'Inns', '50s']], 'most-fifties')
-        
-        # Most sixes
-        if '6s' in batting_df.columns:
-            sixes_df = batting_df[['Player', 'Team', 'Mat', 'Inns', '6s']].copy()
-            sixes_df = sixes_df.sort_values(by='6s', ascending=False).reset_index(drop=True)
-            sixes_df['Rank'] = range(1, len(sixes_df) + 1)
-            save_to_csv(sixes_df[['Rank', 'Player', 'Team', 'Mat', 'Inns', '6s']], 'most-6s')
+        if batting_df is None:
+            # Check if we have the main batting stats file
+            batting_stats_file = EXISTING_BATTING_STATS_FILE
+            if not os.path.exists(batting_stats_file):
+                print(f"{Fore.RED}Batting stats file {batting_stats_file} not found.{Style.RESET_ALL}")
+                return False
+            
+            # Read only the columns the derived stat files use
+            batting_df = pd.read_csv(batting_stats_file, usecols=lambda column: column in BATTING_BACKUP_COLUMNS)
         
-        # Most fours
-        if '4s' in batting_df.columns:
-            fours_df = batting_df[['Player', 'Team', 'Mat', 'Inns', '4s']].copy()
-            fours_df = fours_df.sort_values(by='4s', ascending=False).reset_index(drop=True)
-            fours_df['Rank'] = range(1, len(fours_df) + 1)
-            save_to_csv(fours_df[['Rank', 'Player', 'Team', 'Mat', 'Inns', '4s']], 'most-4s')
+        # Create derived stat files for the batting count stats
+        for stat_type, spec in STAT_SPECS.items():
+            value_column = spec['value_column']
+            if not spec['from_batting_backup'] or value_column not in batting_df.columns:
+                continue
+            # The most runs frame scraped this run still holds these columns as strings
+            derived_df = batting_df[spec['columns'][1:]].assign(**{value_column: pd.to_numeric(batting_df[value_column], errors='coerce')})
+            # A stable sort keeps tied players in file order and players without a value at the end
+            derived_df = derived_df.sort_values(value_column, ascending=False, kind='stable').reset_index(drop=True)
+            derived_df.insert(0, 'Rank', np.arange(1, len(derived_df) + 1, dtype=np.int32))
+            save_to_csv(derived_df, stat_type)
         
         return True
     
@@ -837,37 +849,44 @@ def move_existing_files():
     """Move existing CSV and HTML files to their appropriate folders"""
     print(f"\n{Fore.CYAN}===== Organizing Existing Files ====={Style.RESET_ALL}")
     
-    # Move CSV files
-    for filename in os.listdir('.'):
-        if filename.endswith('.csv'):
-            if any(stat in filename for stat in ['most-runs', 'most-hundreds', 'most-fifties', 'most-6s', 'most-4s']):
-                dest_folder = FOLDERS['batting_stats']
-            elif any(stat in filename for stat in ['most-wickets', 'most-maidens', 'best-bowling-average', 'best-bowling-strike-rate', 'best-economy-rates']):
-                dest_folder = FOLDERS['bowling_stats']
+    # Classify every file in one pass over the directory
+    with os.scandir('.') as entries:
+        for entry in entries:
+            filename = entry.name
+            if not entry.is_file():
+                continue
+            
+            if filename.endswith('.csv'):
+                # Move CSV files
+                match = STAT_FILE_PATTERN.search(filename)
+                if not match:
+                    continue
+                dest_folder = FOLDERS[f"{STAT_SPECS[match.group(0)]['category']}_stats"]
+            elif filename.endswith('.html') and filename.startswith('page_'):
+                # Move HTML files
+                dest_folder = FOLDERS['debug_files']
+                os.makedirs(dest_folder, exist_ok=True)
             else:
                 continue
-                
+            
             dest_path = os.path.join(dest_folder, filename)
             try:
-                os.rename(filename, dest_path)
+                os.replace(filename, dest_path)
                 print(f"Moved {filename} to {dest_folder}/")
             except Exception as e:
                 print(f"{Fore.RED}Error moving {filename}: {e}{Style.RESET_ALL}")
-    
-    # Move HTML files
-    for filename in os.listdir('.'):
-        if filename.endswith('.html') and filename.startswith('page_'):
-            dest_path = os.path.join(FOLDERS['debug_files'], filename)
-            try:
-                os.rename(filename, dest_path)
-                print(f"Moved {filename} to {FOLDERS['debug_files']}/")
-            except Exception as e:
-                print(f"{Fore.RED}Error moving {filename}: {e}{Style.RESET_ALL}")
 
 if __name__ == "__main__":
-    print(f"{Fore.CYAN}======================================{Style.RESET_ALL}")
+    parser = argparse.ArgumentParser(description="Scrape IPL batting and bowling statistics")
+    parser.add_argument('--no-html', action='store_true',
+                        help="only write the JSON summary, skipping the HTML report")
+    parser.add_argument('--refresh', action='store_true',
+                        help="download the stats pages even if copies saved in the last 6 hours exist")
+    args = parser.parse_args()
+    
+    print(BANNER_LINE)
     print(f"{Fore.CYAN}      IPL STATISTICS SCRAPER         {Style.RESET_ALL}")
-    print(f"{Fore.CYAN}======================================{Style.RESET_ALL}")
+    print(BANNER_LINE)
     print(f"Current time: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
     # Create folder structure
@@ -878,12 +897,13 @@ if __name__ == "__main__":
     
     # Scrape all stats pages
     print(f"\n{Fore.CYAN}Starting to scrape all IPL stats pages...{Style.RESET_ALL}")
-    results = scrape_all_stats()
+    results = scrape_all_stats(want_html=not args.no_html, force_refresh=args.refresh)
     
     # If some stats failed, try extracting from existing data
     if not all(result['success'] for result in results.values()):
         print(f"\n{Fore.YELLOW}Some statistics failed to scrape. Trying to extract from existing data...{Style.RESET_ALL}")
-        extract_data_from_existing_csv()
+        # Reuse the most runs table from this run rather than re-reading it from disk
+        extract_data_from_existing_csv(results['most-runs'].get('df'))
     
     print(f"\n{Fore.GREEN}All scraping tasks completed.{Style.RESET_ALL}")
-    print(f"{Fore.CYAN}======================================{Style.RESET_ALL}")
\ No newline at end of file
+    print(BANNER_LINE)
\ No newline at end of file